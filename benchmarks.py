@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:20:41 2026
+
+@author: alain
+
+Benchmarks of the generator
+
+- catalog_memory : memory used by the wrappers loaded from catalogs
+- node_tables    : node creation with the sockets tables set in __init__ vs class constants
+                   (requires Blender and geonodes)
+- node_registry  : dynamic creation of nodes by bl_idname (requires Blender and geonodes)
+- slots_memory   : memory and build time of instances with and without __slots__, on classes
+                   standing for the generated node classes (why the generator has no slots option)
+- node_defaults  : parameters written in __init__ vs only the non default ones, on a tree of
+                   Math, Compare and VectorMath nodes (requires Blender and geonodes)
+- node_links     : input sockets plugged one by one vs queued by plug_sockets and plugged
+                   when the tree exits
+                   (requires Blender and geonodes)
+- pure_nodes     : nodes count and build time of the generated test file with and without
+                   sharing the pure nodes (requires Blender and geonodes)
+- return_class   : call overhead of the return class import in the method vs the lazy module
+
+Use:
+
+from generator import benchmarks
+
+benchmarks.catalog_memory("catalog 3.6.json")
+benchmarks.catalog_memory(["catalog 3.5.json", "catalog 3.6.json"])
+
+benchmarks.node_tables('GeometryNodeCaptureAttribute', count=10000)
+benchmarks.node_registry(count=10000)
+benchmarks.slots_memory(count=200000)
+benchmarks.node_defaults(count=30000)
+benchmarks.node_links(count=20000)
+benchmarks.pure_nodes("/path/to/geonodes/test_file.py")
+benchmarks.return_class(count=1000000)
+benchmarks.return_class(module='json', name='JSONDecoder')   # without geonodes
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from types import MappingProxyType
+
+from generator import nodes_gen
+
+# ====================================================================================================
+# Memory used by loaded catalogs
+#
+# The json files are read before tracing: only the wrappers built from the catalogs are measured.
+# The wrappers of all the catalogs are kept alive to measure them resident together.
+
+def catalog_memory(fnames):
+
+    if isinstance(fnames, str):
+        fnames = [fnames]
+
+    catalogs = [nodes_gen.read_catalog(fname) for fname in fnames]
+
+    resident = []
+    gc.collect()
+    tracemalloc.start()
+
+    print()
+    print("Catalog memory")
+    print()
+    print(f"{'version':12s} {'nodes':>6s} {'total':>10s} {'per node':>10s}")
+
+    total_size  = 0
+    total_nodes = 0
+    for catalog in catalogs:
+        before = tracemalloc.get_traced_memory()[0]
+
+        wnodes = [nodes_gen.WNode.FromDict(data) for data in catalog['nodes'].values()]
+        resident.append(wnodes)
+
+        size = tracemalloc.get_traced_memory()[0] - before
+        count = max(1, len(wnodes))
+        print(f"{str(catalog['VERSION']):12s} {len(wnodes):6d} {size/1024:7.1f} kB {size/count:8.0f} B")
+
+        total_size  += size
+        total_nodes += len(wnodes)
+
+    tracemalloc.stop()
+
+    print()
+    print(f"Total: {total_size/1024:.1f} kB for {total_nodes} nodes, {total_size/max(1, total_nodes):.0f} bytes per node")
+    print()
+
+    return total_size, total_nodes
+
+# ====================================================================================================
+# Node wrapper, from the loaded catalog or from Blender
+
+def get_wnode(bl_idname):
+
+    wnode = nodes_gen.WNode.WNODES.get(bl_idname)
+    if wnode is None:
+        for bnode in nodes_gen.BNodes.stream([bl_idname]):
+            wnode = nodes_gen.WNode(bnode)
+            wnode.detach()
+
+    if wnode is None:
+        raise Exception(f"Benchmark: impossible to create the node '{bl_idname}'")
+
+    return wnode
+
+# ----------------------------------------------------------------------------------------------------
+# Compile the generated class of a node
+
+def node_class(wnode, **kwargs):
+
+    from geonodes.core.node import Node
+
+    namespace = {'Node': Node, 'MappingProxyType': MappingProxyType}
+    exec("".join(wnode.gen_node_class(**kwargs)), namespace)
+
+    return namespace[wnode.node_name]
+
+# ----------------------------------------------------------------------------------------------------
+# Create count nodes in a tree and measure the time and the python memory allocated per node
+
+def create_nodes(cls, count, tree_name):
+
+    import geonodes as gn
+
+    with gn.Tree(tree_name):
+        gc.collect()
+        tracemalloc.start()
+
+        t0 = time.perf_counter()
+        nodes = [cls() for _ in range(count)]
+        duration = time.perf_counter() - t0
+
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+    del nodes
+
+    return duration, size
+
+# ====================================================================================================
+# Sockets tables in __init__ vs class constants
+
+def node_tables(bl_idname='GeometryNodeCaptureAttribute', count=10000, tree_name="Benchmark"):
+
+    wnode = get_wnode(bl_idname)
+
+    print()
+    print(f"Sockets tables: {count} nodes {wnode.node_name} ({bl_idname})")
+    print()
+
+    res = {}
+    for label, class_sockets in [("__init__", False), ("class", True)]:
+        duration, size = create_nodes(node_class(wnode, class_sockets=class_sockets), count, tree_name)
+        res[label] = (duration, size)
+        print(f"{label:10s}: {duration:6.2f} s, {duration/count*1e6:7.1f} µs per node, {size/count:6.0f} bytes per node")
+
+    print()
+
+    return res
+
+# ====================================================================================================
+# Dynamic creation by bl_idname
+#
+# The previous create_node built the dict of all the classes at each call: it is rebuilt from the
+# registry of the generated module to compare the dispatch costs. All the classes are loaded first.
+# The creation is then measured with create_node and create_nodes_many.
+
+def node_registry(count=10000, bl_idnames=('ShaderNodeMath', 'FunctionNodeCompare', 'GeometryNodeSetPosition'), tree_name="Benchmark"):
+
+    import geonodes as gn
+    from geonodes.nodes import nodes
+
+    classes = {bl_idname: nodes.NODE_CLASSES[bl_idname] for bl_idname in nodes.NODE_NAMES}
+
+    sdict = ", ".join([f"'{bl_idname}': {cls.__name__}" for bl_idname, cls in classes.items()])
+    namespace = {cls.__name__: cls for cls in classes.values()}
+    exec(f"def resolve(bl_idname):\n    nodes = {{{sdict}}}\n    return nodes[bl_idname]\n", namespace)
+    old_resolve = namespace['resolve']
+
+    specs = [(bl_idnames[i % len(bl_idnames)], {}) for i in range(count)]
+
+    print()
+    print(f"Dynamic creation of {count} nodes among {len(classes)} classes")
+    print()
+
+    res = {}
+
+    t0 = time.perf_counter()
+    for bl_idname, _ in specs:
+        old_resolve(bl_idname)
+    res['resolve dict per call'] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for bl_idname, _ in specs:
+        nodes.NODE_CLASSES[bl_idname]
+    res['resolve registry'] = time.perf_counter() - t0
+
+    with gn.Tree(tree_name):
+        t0 = time.perf_counter()
+        for bl_idname, kwargs in specs:
+            nodes.create_node(bl_idname, **kwargs)
+        res['create_node'] = time.perf_counter() - t0
+
+    with gn.Tree(tree_name):
+        t0 = time.perf_counter()
+        nodes.create_nodes_many(specs)
+        res['create_nodes_many'] = time.perf_counter() - t0
+
+    for label, duration in res.items():
+        print(f"{label:22s}: {duration:6.3f} s, {duration/count*1e6:8.2f} µs per node, {count/duration:10.0f} nodes/s")
+    print()
+
+    return res
+
+# ====================================================================================================
+# __slots__ on the generated classes
+#
+# The generator has no option to emit __slots__: this benchmark records why.
+# The generated node classes derive from geonodes.core.node.Node which has an instance __dict__.
+# __slots__ in a subclass doesn't remove the __dict__ of the base: the instance keeps its __dict__
+# and gets the slots on top of it. Only a base chain declaring __slots__ everywhere saves memory,
+# which would be a change in geonodes, not in the generated code.
+#
+# Three versions of a class standing for a generated node are built count times:
+# - dict    : subclass without __slots__ of a base with a __dict__ (current generated code)
+# - slots   : subclass with __slots__ of the same base (what the option generated)
+# - chained : __slots__ in the base and in the subclass (requires changing geonodes)
+#
+# Measured with count=200000, Python 3.11.7 on Linux x86_64 (RSS and time vary by +-20% between runs,
+# the sizes don't):
+#
+# version   bytes/inst   RSS delta  build time
+# dict           112.0    27.2 MB     0.342 s
+# slots          112.0    23.9 MB     0.266 s
+# chained         72.0    13.4 MB     0.412 s
+#
+# With 1000000 instances: dict 136.3 MB / 1.94 s, slots 128.0 MB / 1.73 s, chained 77.7 MB / 2.05 s.
+
+def rss():
+    try:
+        with open("/proc/self/statm", 'r') as f:
+            return int(f.read().split()[1])*os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return 0
+
+def slots_classes():
+
+    class DictBase:
+        def __init__(self):
+            self.bnode   = None
+            self.label   = None
+            self._cache  = None
+
+    class SlotsBase:
+        __slots__ = ('bnode', 'label', '_cache')
+        def __init__(self):
+            self.bnode   = None
+            self.label   = None
+            self._cache  = None
+
+    class DictNode(DictBase):
+        def __init__(self):
+            super().__init__()
+            self.data_type = 'FLOAT'
+            self.domain    = 'POINT'
+
+    class SlotsNode(DictBase):
+        __slots__ = ('data_type', 'domain')
+        def __init__(self):
+            super().__init__()
+            self.data_type = 'FLOAT'
+            self.domain    = 'POINT'
+
+    class ChainedNode(SlotsBase):
+        __slots__ = ('data_type', 'domain')
+        def __init__(self):
+            super().__init__()
+            self.data_type = 'FLOAT'
+            self.domain    = 'POINT'
+
+    return {'dict': DictNode, 'slots': SlotsNode, 'chained': ChainedNode}
+
+def slots_memory(count=200000):
+
+    print()
+    print(f"__slots__ on the node classes: {count} instances")
+    print()
+    print(f"{'version':8s} {'bytes/inst':>11s} {'RSS delta':>11s} {'build time':>11s}")
+
+    res = {}
+    for label, cls in slots_classes().items():
+
+        # Build time and RSS without tracing
+        gc.collect()
+        before_rss = rss()
+
+        t0 = time.perf_counter()
+        nodes = [cls() for _ in range(count)]
+        duration = time.perf_counter() - t0
+
+        delta_rss = rss() - before_rss
+        del nodes
+
+        # Size of the instances, the list of the instances excluded
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        nodes = [cls() for _ in range(count)]
+        size = (tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(nodes))/count
+        tracemalloc.stop()
+
+        res[label] = {'size': size, 'rss': delta_rss, 'time': duration}
+        print(f"{label:8s} {size:11.1f} {delta_rss/1e6:8.1f} MB {duration:9.3f} s")
+
+        del nodes
+
+    print()
+
+    return res
+
+# ====================================================================================================
+# Parameters writes in __init__
+#
+# Most of the nodes of a tree keep the default value of most of their parameters.
+# The nodes are created with their default parameters except for one node out of
+# non_default_every, created with the last value of its first enum parameter.
+
+def node_defaults(count=30000, bl_idnames=('ShaderNodeMath', 'FunctionNodeCompare', 'ShaderNodeVectorMath'), non_default_every=4, tree_name="Benchmark"):
+
+    import geonodes as gn
+
+    wnodes = [get_wnode(bl_idname) for bl_idname in bl_idnames]
+
+    specs = []
+    for i in range(count):
+        wnode = wnodes[i % len(wnodes)]
+        kwargs = {}
+        if i % non_default_every == 0:
+            for name, param in wnode.parameters.items():
+                if param.is_enum:
+                    kwargs[name] = param.values[-1]
+                    break
+        specs.append((i % len(wnodes), kwargs))
+
+    print()
+    print(f"Parameters writes: {count} nodes among {', '.join([wnode.node_name for wnode in wnodes])}")
+    print()
+
+    res = {}
+    for label, skip_defaults in [("all", False), ("non default", True)]:
+        classes = [node_class(wnode, skip_defaults=skip_defaults) for wnode in wnodes]
+
+        with gn.Tree(tree_name):
+            t0 = time.perf_counter()
+            for index, kwargs in specs:
+                classes[index](**kwargs)
+            duration = time.perf_counter() - t0
+
+        res[label] = duration
+        print(f"{label:12s}: {duration:6.2f} s, {duration/count*1e6:7.1f} µs per node")
+
+    print()
+
+    return res
+
+# ====================================================================================================
+# Links creation
+#
+# A chain of Math nodes, each one plugged twice to the previous one
+# The tree exit is timed: the queued links are created there
+
+def node_links(count=20000, tree_name="Benchmark"):
+
+    import geonodes as gn
+
+    wnode = get_wnode('ShaderNodeMath')
+
+    print()
+    print(f"Links creation: chain of {count} nodes {wnode.node_name}, {2*count} links")
+    print()
+
+    res = {}
+    for label, batch_links in [("one by one", False), ("batched", True)]:
+        cls = node_class(wnode, batch_links=batch_links)
+
+        t0 = time.perf_counter()
+        with gn.Tree(tree_name):
+            node = cls()
+            for _ in range(count):
+                node = cls(node.value, node.value)
+        duration = time.perf_counter() - t0
+
+        res[label] = duration
+        print(f"{label:12s}: {duration:6.2f} s, {2*count/duration:10.0f} links/s")
+
+    print()
+
+    return res
+
+# ====================================================================================================
+# Sharing of the pure nodes
+#
+# The generated test file builds the tree 'Geometry Nodes' calling all the generated methods.
+# It is run with and without sharing the pure nodes (see nodes_gen.PURE_NODES_SOURCE).
+
+def pure_nodes(fname, tree_name="Geometry Nodes"):
+
+    import bpy
+    from geonodes.nodes import nodes
+
+    with open(fname, 'r') as f:
+        code = compile(f.read(), fname, 'exec')
+
+    print()
+    print(f"Pure nodes sharing: {fname}")
+    print()
+
+    share = nodes.SHARE_PURE_NODES
+    res = {}
+    try:
+        for label, shared in [("new nodes", False), ("shared", True)]:
+            nodes.SHARE_PURE_NODES = shared
+
+            t0 = time.perf_counter()
+            exec(code, {'__name__': '__main__'})
+            duration = time.perf_counter() - t0
+
+            count = len(bpy.data.node_groups[tree_name].nodes)
+            res[label] = (duration, count)
+            print(f"{label:10s}: {duration:6.2f} s, {count:6d} nodes")
+    finally:
+        nodes.SHARE_PURE_NODES = share
+
+    (d0, n0), (d1, n1) = res.values()
+    print()
+    print(f"Delta     : {d1 - d0:+6.2f} s, {n1 - n0:+6d} nodes")
+    print()
+
+    return res
+
+# ====================================================================================================
+# Return class of the generated methods
+#
+# The generated methods returned gn.Float(...) after importing geonodes in their body.
+# They now read gn from the lazy module geonodes.nodes.lazy (see code_gen.LAZY_MODULE).
+# Only the resolution of the class is measured: the class is not called.
+
+def return_class(count=1000000, module='geonodes', name='Float'):
+
+    from generator import code_gen
+
+    namespace = {}
+    exec(code_gen.LAZY_MODULE.replace("LazyModule('geonodes')", f"LazyModule('{module}')"), namespace)
+
+    exec(f"def in_body():\n    import {module} as gn\n    return gn.{name}\n", namespace)
+    exec(f"def lazy():\n    return gn.{name}\n", namespace)
+
+    print()
+    print(f"Return class {module}.{name}: {count} calls")
+    print()
+
+    res = {}
+    for label in ['in_body', 'lazy']:
+        f = namespace[label]
+        f()
+
+        t0 = time.perf_counter()
+        for _ in range(count):
+            f()
+        duration = time.perf_counter() - t0
+
+        res[label] = duration
+        print(f"{label:8s}: {duration:6.3f} s, {duration/count*1e9:6.1f} ns per call")
+
+    print()
+
+    return res
@@ -6,6 +6,9 @@ Created on Tue Dec 13 17:41:59 2022
 @author: alain
 """
 
+import json
+import inspect
+
 # ====================================================================================================
 # Class hierarchy
 
@@ -101,7 +104,10 @@ class Generator:
         self.ret_socket_  = None                # socket to return, returns node if None. Can be a tuple
         self.ret_class_   = None                # type of the return socket. Ignore if socket is None. must be a tuple if ret_socket is tuple.
         self.ret_node     = None                # return the node rather than a socket
-        self.cache        = False               # use a cache for the node
+        self.cache        = None                # cache the node in the socket, None: automatic (see use_cache)
+        self.fold         = True                # constant folding if all the operands are literals (see FOLDED_NODES)
+        self.share        = True                # pure nodes shared in the tree (see PURE_NODES)
+        self.fuse         = True                # stack fusion with the previous node (see FUSED_NODES)
         self.dtype        = None                # (data_type, value, color) implements: data_type = self.value_data_type(argument, data_type, color)
         
         self.is_domain    = False               # domain method
@@ -220,6 +226,38 @@ class Generator:
     def indent(self, n):
         return self.indent_ + Generator.INDENT*n
 
+    # ----------------------------------------------------------------------------------------------------
+    # Node cache
+    #
+    # The node is cached in the data socket (see NodeCache) and created once until the socket is stacked.
+    # Automatic cache (cache=None) for the properties of data sockets returning an output socket:
+    # their result is a function of the socket only.
+    # The key is the node creation: the properties creating the same node share it.
+    # The values of the arguments are part of the key of the methods.
+    
+    def use_cache(self, node):
+        if self.cache is None:
+            return self.decorator == '@property' and self.self_ is not None and self.ret_socket is not None and \
+                not (self.stack or self.attribute or self.is_domain)
+        else:
+            return self.cache
+        
+    def cache_key(self, node):
+        args = node.get_node_arguments()
+        skey = f"{node.bl_idname}({args.node_init_arguments(**self.kwargs)})".replace('"', '\\"')
+        skey = f'"{skey}"'
+        
+        names = []
+        for sarg in args.method_header(**self.kwargs):
+            name = sarg.split('=')[0].strip().lstrip('*')
+            if name not in ['self', 'cls']:
+                names.append(name)
+                
+        if self.decorator == '@property' or not names:
+            return skey
+        else:
+            return f"({skey}, {', '.join(names)})"
+
     # ----------------------------------------------------------------------------------------------------
     # fname is either fixed or provided by the node
     
@@ -250,8 +288,51 @@ class Generator:
         
         args = node.get_node_arguments()
         call_arguments = args.node_init_arguments(**self.kwargs)
-            
-        return f"nodes.{node.node_name}({call_arguments})"
+        
+        if self.sharing(node):
+            return f"nodes.pure_node(nodes.{node.node_name}, {call_arguments})"
+        else:
+            return f"nodes.{node.node_name}({call_arguments})"
+        
+    # ----------------------------------------------------------------------------------------------------
+    # Is the node shared
+    
+    # The methods returning the node don't share it: the caller could modify it
+    
+    def sharing(self, node):
+        return self.share and is_pure_node(node.bl_idname) and self.decorator != 'setter' and \
+            not (self.use_cache(node) or self.stack or self.attribute or self.return_node(node))
+    
+    # ----------------------------------------------------------------------------------------------------
+    # Constant folding
+    #
+    # Only for the functions: the methods are called on a socket, which is not a literal
+    
+    def folding(self, node):
+        return self.fold and node.bl_idname in FOLDED_NODES and self.ret_socket is not None and \
+            self.first_arg is None and self.self_ is None and not (self.use_cache(node) or self.stack or self.attribute)
+    
+    def fold_call_str(self, node):
+        
+        args = node.get_node_arguments()
+        call_arguments = args.node_init_arguments(**self.kwargs)
+        
+        return f"folding.fold('{node.bl_idname}', '{self.ret_socket}', {call_arguments})"
+    
+    # The folded value is returned as a socket of the class returned by the node
+    
+    def folded_class(self, node):
+        if self.ret_class is not None and self.ret_class != 'cls':
+            return self.ret_class
+        wsocks = node.outputs.unames[self.ret_socket]
+        return (wsocks[0] if isinstance(wsocks, list) else wsocks).class_name
+    
+    # ----------------------------------------------------------------------------------------------------
+    # Stack fusion
+    
+    def fusion(self, node):
+        return self.fuse and self.stack and node.bl_idname in FUSED_NODES and \
+            not (self.use_cache(node) or self.attribute)
     
     # ----------------------------------------------------------------------------------------------------
     # The call string
@@ -309,7 +390,10 @@ class Generator:
             yield "```\n"
         
         if node is not None:
-            yield f"> Node: [{node.bnode.name}]({node.bl_idname}.md) | [Blender reference]({node.blender_ref}) | [api reference]({node.blender_python_ref})\n\n"
+            yield f"> Node: [{node.blender_name}]({node.bl_idname}.md) | [Blender reference]({node.blender_ref}) | [api reference]({node.blender_python_ref})\n\n"
+            
+            if self.sharing(node):
+                yield "> The node is shared by the identical calls in the tree (see nodes.pure_node): don't modify the node of the returned socket.\n\n"
 
         
         if self.com_descr is not None:
@@ -374,7 +458,10 @@ class Generator:
     # ----------------------------------------------------------------------------------------------------
     # Generate the source code
         
-    def gen_source(self, node):
+    # doc_store : lean generation, the documentation is written in the doc store under doc_key
+    #             and the docstring is a stub
+        
+    def gen_source(self, node, doc_store=None, doc_key=None):
         
         if self.no_code:
             return
@@ -421,16 +508,22 @@ class Generator:
         for line in self.gen_markdown(node):
             if line is not None:
                 text += line 
-        lines = text.split("\n")
-        del text
-        
-        yield self.indent(1) + '"""\n\n'    
-        for line in lines:
-            if line == "":
-                yield "\n"
-            else:
-                yield self.indent(1) + line + "\n"
-        yield self.indent(1) + '"""\n\n'
+                
+        if doc_store is not None:
+            doc_store.add(doc_key, text)
+            yield self.indent(1) + f'"""Node {node.blender_name} (see docstore.help)"""\n\n'
+            
+        else:
+            lines = text.split("\n")
+            del text
+            
+            yield self.indent(1) + '"""\n\n'    
+            for line in lines:
+                if line == "":
+                    yield "\n"
+                else:
+                    yield self.indent(1) + line + "\n"
+            yield self.indent(1) + '"""\n\n'
 
             
         # ----------------------------------------------------------------------------------------------------
@@ -446,11 +539,10 @@ class Generator:
 
             return
         
-        # ----- Import class name if required
+        # ----- Return class read in the lazy module gn (see LAZY_MODULE)
         
         s_gn = ""
         if self.ret_class is not None and self.ret_class != 'cls':
-            yield self.indent(1) + "import geonodes as gn\n"
             s_gn = "gn."
 
         # ----- body start
@@ -480,6 +572,13 @@ class Generator:
             yield self.indent(1) + f"{self.dtype[0]}_ = self.value_data_type({self.dtype[1]}, {default_data_type}{scolor})\n"
             self.kwargs[self.dtype[0]] = f"{self.dtype[0]}_"
         
+        # ----- Result computed in python if all the operands are literals
+        
+        if self.folding(node):
+            yield self.indent(1) + f"folded = {self.fold_call_str(node)}\n"
+            yield self.indent(1) + "if folded is not None:\n"
+            yield self.indent(2) + f"return gn.{self.folded_class(node)}(folded)\n\n"
+            
         # ----- Node creation string
 
         snode = f"{self.node_call_str(node)}"
@@ -499,17 +598,22 @@ class Generator:
         # ----- Cache mechanism
         # node = ...
             
-        if self.cache:
-            cache_name = node.bl_idname.lower()
-            yield self.indent(1) + f"if not hasattr(self, '_c_{cache_name}'):\n"
-            yield self.indent(2) + f"self._c_{cache_name} = {snode}\n"
-            snode = f"self._c_{cache_name}"
+        if self.use_cache(node):
+            key = self.cache_key(node)
+            yield self.indent(1) + f"node = self.cached_node({key})\n"
+            yield self.indent(1) + "if node is None:\n"
+            yield self.indent(2) + f"node = self.cache_node({key}, {snode})\n"
+            snode = "node"
             
         # ----- Stack
         # stack function returns a socket or a node
             
         if stack_func is not None:
-            ssock = f"self.{stack_func}({snode})"
+            if self.fusion(node):
+                call_arguments = node.get_node_arguments().node_init_arguments(**self.kwargs)
+                ssock = f"fusion.stack(self, '{stack_func}', '{node.bl_idname}', lambda: {snode}, {call_arguments})"
+            else:
+                ssock = f"self.{stack_func}({snode})"
             snode = ssock + ".node"
 
         # ----- Return node, a socket or a tuple of sockets
@@ -749,6 +853,708 @@ class Comment(Generator):
         super().__init__(no_code=True, **kwargs)
 
         
+# ====================================================================================================
+# Doc store
+#
+# In lean generation, the docstrings are stubs and the documentation is written in a single file:
+#
+#   GNDOCS 1
+#   {"key": [offset, length], ...}       : one json line
+#   texts                                : utf-8 texts, offsets relative to the start of the texts
+#
+# The keys are the qualified names prefixed by the module for the nodes and functions:
+# 'nodes.Math', 'functions.sin', 'Mesh.set_position'
+#
+# The generated module geonodes.docstore reads the documentation on demand (see DOCSTORE_MODULE)
+
+class DocStore(dict):
+    
+    HEADER = "GNDOCS 1\n"
+    
+    def add(self, key, text):
+        self[key] = inspect.cleandoc(text)
+        
+    def write(self, fname):
+        table = {}
+        texts = []
+        offset = 0
+        for key, text in self.items():
+            data = text.encode('utf-8')
+            table[key] = [offset, len(data)]
+            texts.append(data)
+            offset += len(data)
+            
+        with open(fname, 'wb') as f:
+            f.write(DocStore.HEADER.encode('utf-8'))
+            f.write((json.dumps(table) + "\n").encode('utf-8'))
+            for data in texts:
+                f.write(data)
+                
+# ----------------------------------------------------------------------------------------------------
+# Source code of the documentation accessor
+
+DOCSTORE_MODULE = '''# geonodes doc store
+#
+# Documentation of the generated classes when generated in lean mode
+#
+# from geonodes import docstore
+#
+# docstore.help(gn.Mesh.set_position)  : help with the full documentation
+# docstore.doc(gn.Mesh.set_position)   : full documentation
+# docstore.attach(gn.Mesh)             : set __doc__ of a class and of its methods
+#
+# The documentation of a property setter is read with the key suffixed by .setter:
+# docstore.doc('Mesh.material.setter')
+
+import os
+import json
+import builtins
+
+FNAME = os.path.join(os.path.dirname(__file__), "docstore.gnd")
+
+_table  = None
+_offset = 0
+
+def table():
+    global _table, _offset
+    if _table is None:
+        _table = {}
+        if os.path.exists(FNAME):
+            with open(FNAME, 'rb') as f:
+                f.readline()
+                _table  = json.loads(f.readline())
+                _offset = f.tell()
+    return _table
+
+def key_of(obj):
+    if isinstance(obj, str):
+        return obj
+    if isinstance(obj, property):
+        obj = obj.fget
+    module = getattr(obj, '__module__', "") or ""
+    module = module.split('.')[-1]
+    qualname = getattr(obj, '__qualname__', None)
+    if qualname is None:
+        return None
+    if module.startswith('menu_'):
+        return f"nodes.{qualname}"
+    if module == 'functions':
+        return f"functions.{qualname}"
+    return qualname
+
+def doc(obj):
+    key = key_of(obj)
+    entry = table().get(key)
+    if entry is None:
+        return None if isinstance(obj, str) else obj.__doc__
+    offset, length = entry
+    with open(FNAME, 'rb') as f:
+        f.seek(_offset + offset)
+        return f.read(length).decode('utf-8')
+
+def attach(obj):
+    text = doc(obj)
+    if text is not None:
+        try:
+            obj.__doc__ = text
+        except (AttributeError, TypeError):
+            pass
+    if isinstance(obj, type):
+        for name, member in vars(obj).items():
+            if callable(member) or isinstance(member, property):
+                if key_of(member) in table():
+                    attach(member)
+    return obj
+
+def help(obj):
+    builtins.help(attach(obj))
+'''
+
+def create_docstore_module(fname):
+    with open(fname, 'w') as f:
+        f.write(DOCSTORE_MODULE)
+
+# ====================================================================================================
+# Constant folding
+#
+# The functions creating the nodes of FOLDED_NODES first try to compute the result in python
+# when all the operands are literals. The result is returned in the class of the output socket:
+# gn.sqrt(4) returns gn.Float(2.), a Value input node, rather than a Math node.
+# The generated module geonodes.nodes.folding computes the results (see FOLDING_MODULE)
+
+FOLDED_NODES = ('ShaderNodeMath', 'ShaderNodeVectorMath', 'FunctionNodeCompare', 'FunctionNodeBooleanMath')
+
+# ====================================================================================================
+# Pure nodes
+#
+# The output sockets of these nodes only depend on their parameters and input sockets: the
+# generated methods create them with nodes.pure_node which shares the identical nodes of a tree.
+# The input nodes (bl_idname starting by GeometryNodeInput or FunctionNodeInput) are pure as well.
+# The stack methods, the setters, the cached nodes and the methods returning the node are never shared.
+# The shared node must not be modified after its creation: the generated documentation says so.
+
+PURE_NODES = (
+    'ShaderNodeMath', 'ShaderNodeVectorMath', 'FunctionNodeCompare', 'FunctionNodeBooleanMath',
+    'ShaderNodeCombineXYZ', 'ShaderNodeSeparateXYZ', 'FunctionNodeCombineColor', 'FunctionNodeSeparateColor',
+    'ShaderNodeClamp', 'ShaderNodeMapRange', 'FunctionNodeFloatToInt', 'ShaderNodeVectorRotate',
+    'FunctionNodeAlignEulerToVector', 'FunctionNodeRotateEuler',
+    )
+
+def is_pure_node(bl_idname):
+    return bl_idname in PURE_NODES or bl_idname.startswith(('GeometryNodeInput', 'FunctionNodeInput'))
+
+FOLDING_MODULE = '''# geonodes constant folding
+#
+# Result of the arithmetic and comparison nodes computed in python when all the operands
+# used by the operation are literals (python numbers, booleans, strings or vectors).
+#
+# fold(bl_idname, socket, **kwargs) returns the value of the output socket, or None if
+# the node must be created. The generated functions wrap the value in the socket class,
+# for instance gn.Float(value): the result is a socket in both cases.
+# The node is created when:
+# - one of the operands is a socket or None (unplugged socket)
+# - the operation is not folded
+#
+# The values are computed in double precision when Blender computes in single precision.
+
+import math
+
+# Single precision epsilon, used by Blender in the COMPARE operation of the Math node
+
+FLT_EPSILON = 1.1920928955078125e-07
+
+# ----------------------------------------------------------------------------------------------------
+# Literals
+
+def is_number(value):
+    return type(value) in (int, float, bool)
+
+def is_vector(value):
+    if is_number(value):
+        return True
+    return type(value) in (tuple, list) and len(value) == 3 and all(type(v) in (int, float, bool) for v in value)
+
+def to_vector(value):
+    if is_number(value):
+        return (float(value),) * 3
+    return tuple(float(v) for v in value)
+
+# ----------------------------------------------------------------------------------------------------
+# ShaderNodeMath
+#
+# operation: (number of operands, function)
+
+def safe_divide(a, b):
+    return 0. if b == 0 else a/b
+
+def safe_power(a, b):
+    if a >= 0 or float(b).is_integer():
+        try:
+            return math.pow(a, b)
+        except (OverflowError, ValueError, ZeroDivisionError):
+            return None
+    return 0.
+
+def safe_log(a, b):
+    if a > 0 and b > 0 and b != 1:
+        return math.log(a)/math.log(b)
+    return 0.
+
+def safe_modulo(a, b):
+    return 0. if b == 0 else math.fmod(a, b)
+
+def wrap(value, max, min):
+    range_ = max - min
+    return min if range_ == 0 else value - range_*math.floor((value - min)/range_)
+
+MATH = {
+    'ADD'          : (2, lambda a, b: a + b),
+    'SUBTRACT'     : (2, lambda a, b: a - b),
+    'MULTIPLY'     : (2, lambda a, b: a*b),
+    'DIVIDE'       : (2, safe_divide),
+    'MULTIPLY_ADD' : (3, lambda a, b, c: a*b + c),
+    'POWER'        : (2, safe_power),
+    'LOGARITHM'    : (2, safe_log),
+    'SQRT'         : (1, lambda a: math.sqrt(a) if a > 0 else 0.),
+    'INVERSE_SQRT' : (1, lambda a: 1/math.sqrt(a) if a > 0 else 0.),
+    'ABSOLUTE'     : (1, abs),
+    'EXPONENT'     : (1, math.exp),
+    'MINIMUM'      : (2, min),
+    'MAXIMUM'      : (2, max),
+    'LESS_THAN'    : (2, lambda a, b: 1. if a < b else 0.),
+    'GREATER_THAN' : (2, lambda a, b: 1. if a > b else 0.),
+    'SIGN'         : (1, lambda a: 0. if a == 0 else math.copysign(1., a)),
+    'COMPARE'      : (3, lambda a, b, c: 1. if abs(a - b) <= max(c, FLT_EPSILON) else 0.),
+    'ROUND'        : (1, lambda a: math.floor(a + .5)),
+    'FLOOR'        : (1, math.floor),
+    'CEIL'         : (1, math.ceil),
+    'TRUNC'        : (1, math.trunc),
+    'FRACT'        : (1, lambda a: a - math.floor(a)),
+    'MODULO'       : (2, safe_modulo),
+    'WRAP'         : (3, wrap),
+    'SNAP'         : (2, lambda a, b: 0. if b == 0 else math.floor(a/b)*b),
+    'SINE'         : (1, math.sin),
+    'COSINE'       : (1, math.cos),
+    'TANGENT'      : (1, math.tan),
+    'ARCSINE'      : (1, lambda a: math.asin(max(-1., min(1., a)))),
+    'ARCCOSINE'    : (1, lambda a: math.acos(max(-1., min(1., a)))),
+    'ARCTANGENT'   : (1, math.atan),
+    'ARCTAN2'      : (2, math.atan2),
+    'SINH'         : (1, math.sinh),
+    'COSH'         : (1, math.cosh),
+    'TANH'         : (1, math.tanh),
+    'RADIANS'      : (1, math.radians),
+    'DEGREES'      : (1, math.degrees),
+    }
+
+def fold_math(socket, value0=None, value1=None, value2=None, operation='ADD', use_clamp=False, **kwargs):
+
+    op = MATH.get(operation)
+    if op is None:
+        return None
+
+    args = (value0, value1, value2)[:op[0]]
+    if not all(is_number(arg) for arg in args):
+        return None
+
+    try:
+        value = float(op[1](*args))
+    except (OverflowError, ValueError):
+        return None
+
+    if use_clamp:
+        value = max(0., min(1., value))
+
+    return value
+
+# ----------------------------------------------------------------------------------------------------
+# ShaderNodeVectorMath
+#
+# operation: (number of vector operands, output socket, function)
+
+def vmap(f, *vs):
+    return tuple(f(*cs) for cs in zip(*vs))
+
+def dot(a, b):
+    return a[0]*b[0] + a[1]*b[1] + a[2]*b[2]
+
+def length(a):
+    return math.sqrt(dot(a, a))
+
+def normalize(a):
+    l = length(a)
+    return (0., 0., 0.) if l == 0 else (a[0]/l, a[1]/l, a[2]/l)
+
+VECTOR_MATH = {
+    'ADD'           : (2, 'vector', lambda a, b: vmap(lambda x, y: x + y, a, b)),
+    'SUBTRACT'      : (2, 'vector', lambda a, b: vmap(lambda x, y: x - y, a, b)),
+    'MULTIPLY'      : (2, 'vector', lambda a, b: vmap(lambda x, y: x*y, a, b)),
+    'DIVIDE'        : (2, 'vector', lambda a, b: vmap(safe_divide, a, b)),
+    'MULTIPLY_ADD'  : (3, 'vector', lambda a, b, c: vmap(lambda x, y, z: x*y + z, a, b, c)),
+    'CROSS_PRODUCT' : (2, 'vector', lambda a, b: (a[1]*b[2] - a[2]*b[1], a[2]*b[0] - a[0]*b[2], a[0]*b[1] - a[1]*b[0])),
+    'DOT_PRODUCT'   : (2, 'value',  dot),
+    'DISTANCE'      : (2, 'value',  lambda a, b: length(vmap(lambda x, y: x - y, a, b))),
+    'LENGTH'        : (1, 'value',  length),
+    'NORMALIZE'     : (1, 'vector', normalize),
+    'ABSOLUTE'      : (1, 'vector', lambda a: vmap(abs, a)),
+    'MINIMUM'       : (2, 'vector', lambda a, b: vmap(min, a, b)),
+    'MAXIMUM'       : (2, 'vector', lambda a, b: vmap(max, a, b)),
+    'FLOOR'         : (1, 'vector', lambda a: vmap(lambda x: float(math.floor(x)), a)),
+    'CEIL'          : (1, 'vector', lambda a: vmap(lambda x: float(math.ceil(x)), a)),
+    'FRACTION'      : (1, 'vector', lambda a: vmap(lambda x: x - math.floor(x), a)),
+    'MODULO'        : (2, 'vector', lambda a, b: vmap(safe_modulo, a, b)),
+    'SINE'          : (1, 'vector', lambda a: vmap(math.sin, a)),
+    'COSINE'        : (1, 'vector', lambda a: vmap(math.cos, a)),
+    'TANGENT'       : (1, 'vector', lambda a: vmap(math.tan, a)),
+    }
+
+def fold_vector_math(socket, vector0=None, vector1=None, vector2=None, scale=None, operation='ADD', **kwargs):
+
+    if operation == 'SCALE':
+        if socket != 'vector' or not is_vector(vector0) or not is_number(scale):
+            return None
+        return tuple(v*scale for v in to_vector(vector0))
+
+    op = VECTOR_MATH.get(operation)
+    if op is None or op[1] != socket:
+        return None
+
+    args = (vector0, vector1, vector2)[:op[0]]
+    if not all(is_vector(arg) for arg in args):
+        return None
+
+    try:
+        return op[2](*[to_vector(arg) for arg in args])
+    except (OverflowError, ValueError):
+        return None
+
+# ----------------------------------------------------------------------------------------------------
+# FunctionNodeCompare
+#
+# Folded for FLOAT, INT and STRING data types
+
+COMPARE = {
+    'LESS_THAN'     : lambda a, b: a < b,
+    'LESS_EQUAL'    : lambda a, b: a <= b,
+    'GREATER_THAN'  : lambda a, b: a > b,
+    'GREATER_EQUAL' : lambda a, b: a >= b,
+    }
+
+def fold_compare(socket, a=None, b=None, epsilon=None, data_type='FLOAT', operation='GREATER_THAN', **kwargs):
+
+    if socket != 'result':
+        return None
+
+    if data_type == 'STRING':
+        if type(a) is not str or type(b) is not str:
+            return None
+        if operation == 'EQUAL':
+            return a == b
+        elif operation == 'NOT_EQUAL':
+            return a != b
+        return None
+
+    if data_type not in ('FLOAT', 'INT') or not is_number(a) or not is_number(b):
+        return None
+
+    if data_type == 'INT':
+        a, b = int(a), int(b)
+
+    if operation in COMPARE:
+        return COMPARE[operation](a, b)
+
+    if operation in ('EQUAL', 'NOT_EQUAL'):
+        if data_type == 'INT':
+            equal = a == b
+        elif is_number(epsilon):
+            equal = abs(a - b) <= epsilon
+        else:
+            return None
+        return equal if operation == 'EQUAL' else not equal
+
+    return None
+
+# ----------------------------------------------------------------------------------------------------
+# FunctionNodeBooleanMath
+
+BOOLEAN_MATH = {
+    'AND'    : (2, lambda a, b: a and b),
+    'OR'     : (2, lambda a, b: a or b),
+    'NOT'    : (1, lambda a: not a),
+    'NAND'   : (2, lambda a, b: not (a and b)),
+    'NOR'    : (2, lambda a, b: not (a or b)),
+    'XNOR'   : (2, lambda a, b: a == b),
+    'XOR'    : (2, lambda a, b: a != b),
+    'IMPLY'  : (2, lambda a, b: (not a) or b),
+    'NIMPLY' : (2, lambda a, b: a and not b),
+    }
+
+def fold_boolean_math(socket, boolean0=None, boolean1=None, operation='AND', **kwargs):
+
+    op = BOOLEAN_MATH.get(operation)
+    if op is None or socket != 'boolean':
+        return None
+
+    args = (boolean0, boolean1)[:op[0]]
+    if not all(type(arg) is bool for arg in args):
+        return None
+
+    return op[1](*args)
+
+# ----------------------------------------------------------------------------------------------------
+# Dispatch
+
+FOLDERS = {
+    'ShaderNodeMath'          : fold_math,
+    'ShaderNodeVectorMath'    : fold_vector_math,
+    'FunctionNodeCompare'     : fold_compare,
+    'FunctionNodeBooleanMath' : fold_boolean_math,
+    }
+
+def fold(bl_idname, socket, **kwargs):
+    return FOLDERS[bl_idname](socket, **kwargs)
+'''
+
+def create_folding_module(fname):
+    with open(fname, 'w') as f:
+        f.write(FOLDING_MODULE)
+        
+# ====================================================================================================
+# Nodes cache of the data sockets
+#
+# The generated classes deriving from a geonodes class derive from NodeCache.
+# The cached nodes are created with the socket as input: they are dropped when the
+# socket is stacked, i.e. when it is replaced by the output socket of a new node.
+
+CACHE_MODULE = '''# geonodes nodes cache
+#
+# Nodes cached in a data socket or in a domain
+#
+# node = self.cached_node(key)
+# if node is None:
+#     node = self.cache_node(key, nodes.DomainSize(geometry=self, component='MESH'))
+#
+# The cache is valid for the Blender socket of the data socket (the data socket of a domain):
+# stacking a node on the data socket changes its socket and invalidates its cache and the caches
+# of all its domains.
+# stack and socket_stack clear the cache as well, the socket_stack of a domain clears the cache
+# of its data socket.
+
+def cache_socket(socket):
+    data_socket = getattr(socket, 'data_socket', None)
+    return getattr(socket if data_socket is None else data_socket, 'bsocket', None)
+
+class NodeCache:
+
+    __slots__ = ()
+
+    def cached_node(self, key):
+        cache = getattr(self, '_node_cache', None)
+        if cache is None or cache[0] != cache_socket(self):
+            return None
+        return cache[1].get(key)
+
+    def cache_node(self, key, node):
+        bsocket = cache_socket(self)
+        cache = getattr(self, '_node_cache', None)
+        if cache is None or cache[0] != bsocket:
+            cache = (bsocket, {})
+            self._node_cache = cache
+        cache[1][key] = node
+        return node
+
+    def clear_node_cache(self):
+        if getattr(self, '_node_cache', None) is not None:
+            self._node_cache = None
+
+    def stack(self, *args, **kwargs):
+        self.clear_node_cache()
+        return super().stack(*args, **kwargs)
+
+    def socket_stack(self, *args, **kwargs):
+        self.clear_node_cache()
+        data_socket = getattr(self, 'data_socket', None)
+        if isinstance(data_socket, NodeCache):
+            data_socket.clear_node_cache()
+        return super().socket_stack(*args, **kwargs)
+'''
+
+def create_cache_module(fname):
+    with open(fname, 'w') as f:
+        f.write(CACHE_MODULE)
+
+# ====================================================================================================
+# Stack fusion
+#
+# The stack methods and setters of FUSED_NODES stack their node with fusion.stack: the operation
+# is fused into the previous node stacked on the same geometry when they compose (see FUSION_MODULE).
+
+FUSED_NODES = ('GeometryNodeSetPosition', 'GeometryNodeTransform', 'GeometryNodeStoreNamedAttribute')
+
+FUSION_MODULE = '''# geonodes stack fusion
+#
+# Consecutive stack operations on a geometry are fused into the previous node when they compose:
+#
+#   mesh.verts.position_offset = (0, 0, 1)
+#   mesh.verts.position_offset = (1, 0, 0)
+#
+# creates one Set Position node with offset (1, 0, 1).
+#
+# A stacked node is fused with the following operation if:
+# - the geometry is still the output socket of the node and this socket is not linked,
+#   neither by a link queued by plug_sockets
+# - the nodes have the same type and the same selection (same socket or both None)
+#   set_position requires a selection None or a constant boolean
+# - the operands are literals, the operands input sockets of the node are not linked
+#   and the operation composes (see RULES)
+#
+# FUSE = False creates a new node at each stack operation.
+
+from geonodes.nodes import is_linked
+
+FUSE = True
+
+# ----------------------------------------------------------------------------------------------------
+# Literals
+
+def is_number(value):
+    return type(value) in (int, float)
+
+def vector(value, default):
+    if value is None:
+        return default
+    if is_number(value):
+        return (float(value),) * 3
+    if type(value) in (tuple, list) and len(value) == 3 and all(is_number(v) for v in value):
+        return tuple(float(v) for v in value)
+    return None
+
+ZERO = (0., 0., 0.)
+ONE  = (1., 1., 1.)
+
+# Input sockets of the node linked since it was created
+
+def linked(node, *names):
+    for name in names:
+        index = node.insockets.get(name)
+        if index is None:
+            continue
+        for i in (index if isinstance(index, list) else [index]):
+            if is_linked(node.bnode.inputs[i]):
+                return True
+    return False
+
+# ----------------------------------------------------------------------------------------------------
+# Rules
+#
+# rule(node, last, new) modifies the previous node and returns its new operands,
+# or None if the operations don't compose
+
+def set_position(node, last, new):
+    """Sum the offsets of two Set Position nodes.
+
+    Only fused when the selection is None or a constant boolean: a selection field is
+    evaluated on the geometry moved by the previous node, fusing would evaluate it on
+    the original geometry.
+    """
+
+    if linked(node, 'selection', 'position', 'offset'):
+        return None
+
+    for kwargs in (last, new):
+        if kwargs.get('selection') is not None and type(kwargs.get('selection')) is not bool:
+            return None
+
+    if last.get('position') is not None or new.get('position') is not None:
+        return None
+
+    offset0 = vector(last.get('offset'), ZERO)
+    offset1 = vector(new.get('offset'), ZERO)
+    if offset0 is None or offset1 is None:
+        return None
+
+    offset = tuple(a + b for a, b in zip(offset0, offset1))
+    node.offset = offset
+
+    return {**last, 'offset': offset}
+
+def transform(node, last, new):
+
+    if linked(node, 'translation', 'rotation', 'scale'):
+        return None
+
+    for kwargs in (last, new):
+        if vector(kwargs.get('rotation'), ZERO) != ZERO:
+            return None
+
+    t0, s0 = vector(last.get('translation'), ZERO), vector(last.get('scale'), ONE)
+    t1, s1 = vector(new.get('translation'),  ZERO), vector(new.get('scale'),  ONE)
+    if None in (t0, s0, t1, s1):
+        return None
+
+    scale       = tuple(a*b for a, b in zip(s0, s1))
+    translation = tuple(s*t + u for s, t, u in zip(s1, t0, t1))
+    node.translation = translation
+    node.scale       = scale
+
+    return {**last, 'translation': translation, 'scale': scale}
+
+def store_named_attribute(node, last, new):
+
+    if linked(node, 'selection', 'name', 'value'):
+        return None
+
+    if last.get('selection') is not None or new.get('selection') is not None:
+        return None
+
+    for name in ('name', 'data_type', 'domain'):
+        if last.get(name) != new.get(name):
+            return None
+
+    if type(last.get('name')) is not str:
+        return None
+
+    value = new.get('value')
+    if not (type(value) in (int, float, bool) or vector(value, None) is not None):
+        return None
+
+    node.value = value
+
+    return {**last, 'value': value}
+
+RULES = {
+    'GeometryNodeSetPosition'         : set_position,
+    'GeometryNodeTransform'           : transform,
+    'GeometryNodeStoreNamedAttribute' : store_named_attribute,
+    }
+
+# ----------------------------------------------------------------------------------------------------
+# Stack with fusion
+#
+# socket : the socket calling the stack method, a geometry or a domain
+# method : 'stack' or 'socket_stack'
+# create : function creating the node to stack
+# kwargs : the arguments of the node
+
+def stack(socket, method, bl_idname, create, **kwargs):
+
+    target = socket.data_socket if method == 'socket_stack' else socket
+
+    last = getattr(target, '_last_stack', None)
+    if FUSE and last is not None and last[0] == bl_idname:
+        _, node, last_kwargs, res = last
+        bsocket = node.bnode.outputs[0]
+        same = last_kwargs.get('selection') is kwargs.get('selection')
+        if same and getattr(target, 'bsocket', None) == bsocket and not is_linked(bsocket):
+            fused = RULES[bl_idname](node, last_kwargs, kwargs)
+            if fused is not None:
+                target._last_stack = (bl_idname, node, fused, res)
+                return socket if res is None else res
+
+    node = create()
+    res = getattr(socket, method)(node)
+    # The result is kept to be returned by the fused operations, None for the socket itself
+    target._last_stack = (bl_idname, node, kwargs, None if res is socket else res)
+
+    return res
+'''
+
+def create_fusion_module(fname):
+    with open(fname, 'w') as f:
+        f.write(FUSION_MODULE)
+        
+# ====================================================================================================
+# Return classes
+#
+# The generated methods return gn.Float(...): gn is imported once by the generated modules
+# from geonodes.nodes.lazy. geonodes imports these modules, it is imported on first use.
+
+LAZY_MODULE = '''# geonodes lazy module
+#
+# from geonodes.nodes.lazy import gn
+#
+# geonodes is imported at the first attribute read, the attributes are then
+# instance attributes of gn
+
+import importlib
+
+class LazyModule:
+
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+
+    def __getattr__(self, name):
+        value = getattr(importlib.import_module(self._name), name)
+        self.__dict__[name] = value
+        return value
+
+gn = LazyModule('geonodes')
+'''
+
+def create_lazy_module(fname):
+    with open(fname, 'w') as f:
+        f.write(LAZY_MODULE)
+        
 # ====================================================================================================
 # Class generator
 
@@ -910,16 +1716,20 @@ class ClassGenerator(dict):
         
     # ----------------------------------------------------------------------------------------------------
     # Generate a class
+    #
+    # The classes deriving from a geonodes class derive from NodeCache as well
                     
-    def gen_class(self, class_name):
+    def gen_class(self, class_name, doc_store=None):
         
         if class_name != 'functions':
             if class_name not in CLASSES:
                 raise Exception(f"{class_name} not in CLASSES!")
                 
             root = CLASSES[class_name][1]
-            if root != "":
+            if root in CLASSES:
                 root = f"({root})"
+            elif root != "":
+                root = f"(NodeCache, {root})"
             yield f"class {class_name}{root}:\n"
         
         # ----- Mehods
@@ -928,11 +1738,13 @@ class ClassGenerator(dict):
         
         # ----- Generate the methods
         
-        for _, gen, wnode in methods:
+        for fname, gen, wnode in methods:
             if wnode is None:
                 continue
             
-            for line in gen.gen_source(wnode):
+            # The setter of a property has its own entry: name.setter (fname is 'name setter')
+            doc_key = f"{class_name}.{gen.fname(wnode)}" + (".setter" if gen.decorator == 'setter' else "")
+            for line in gen.gen_source(wnode, doc_store=doc_store, doc_key=doc_key):
                 yield line
             yield "\n"
                 
@@ -944,12 +1756,10 @@ class ClassGenerator(dict):
         
         with open(file_name, 'w') as f:
             
-            import bpy
-            
             f.write("# geonodes init file\n\n")
             
             f.write(f"version = {version}\n")
-            f.write(f"blender_version={bpy.app.version}\n\n")
+            f.write(f"blender_version={version[:3]}\n\n")
             
             f.write("pi = 3.141592653589793\n\n")
             
@@ -967,7 +1777,7 @@ class ClassGenerator(dict):
     # ----------------------------------------------------------------------------------------------------
     # Create the source code files
         
-    def create_files(self, folder, version=None):
+    def create_files(self, folder, version=None, doc_store=None):
         
         files = []
         for class_name in CLASSES:
@@ -982,13 +1792,21 @@ class ClassGenerator(dict):
                     f.write("from geonodes.nodes import nodes\n")
                     f.write("import geonodes.core.datasockets as geosocks\n")
                     f.write("from geonodes.nodes.domains import Vertex, Edge, Face, Corner, ControlPoint, Spline, CloudPoint, Instance\n")
+                    f.write("from geonodes.nodes.cache import NodeCache\n")
+                    f.write("from geonodes.nodes import fusion\n")
+                    f.write("from geonodes.nodes.lazy import gn\n")
                     
                 elif file_name == 'domains':
                     f.write("from geonodes.nodes import nodes\n")
                     f.write("import geonodes.core.domain as geodom\n")
+                    f.write("from geonodes.nodes.cache import NodeCache\n")
+                    f.write("from geonodes.nodes import fusion\n")
+                    f.write("from geonodes.nodes.lazy import gn\n")
                     
                 elif file_name == 'functions':
                     f.write("from geonodes.nodes import nodes\n")
+                    f.write("from geonodes.nodes import folding\n")
+                    f.write("from geonodes.nodes.lazy import gn\n")
                     
                 f.write("\n")
                 
@@ -998,13 +1816,18 @@ class ClassGenerator(dict):
                         continue
                     
                     ok_lines = False
-                    for line in self.gen_class(class_name):
+                    for line in self.gen_class(class_name, doc_store=doc_store):
                         if line is not None:
                             f.write(line)
                             ok_lines = True
                     if ok_lines:
                         f.write("\n\n")
                     
+        create_folding_module(f"{folder}nodes/folding.py")
+        create_cache_module(f"{folder}nodes/cache.py")
+        create_fusion_module(f"{folder}nodes/fusion.py")
+        create_lazy_module(f"{folder}nodes/lazy.py")
+        
         if version is not None:
             self.create_init_file(folder + '__init__.py', version)
             
@@ -1051,7 +1874,7 @@ class ClassGenerator(dict):
                     if ok_node:
                         yield "|      "
                     else:
-                        yield f"| [{node.bnode.name}]({node.bnode.bl_idname}.md) "
+                        yield f"| [{node.blender_name}]({node.bl_idname}.md) "
                         ok_node = True
                         
                     # Class reference
@@ -1098,27 +1921,7 @@ class ClassGenerator(dict):
         # ----------------------------------------------------------------------------------------------------
         # Nodes menus
         
-        menu = {
-            "Attribute"         : ATTRIBUTE,
-            'Color'             : COLOR,
-            'Curve'             : CURVE,
-            'Curve Primitives'  : CURVE_PRIMITIVES,
-            'Curve Topology'    : CURVE_TOPOLOGY,
-            'Geometry'          : GEOMETRY,
-            'Input'             : INPUT,
-            'Instances'         : INSTANCES,
-            'Material'          : MATERIAL,
-            'Mesh'              : MESH,
-            'Mesh Primitives'   : MESH_PRIMITIVES,
-            'Output'            : OUTPUT,
-            'Point'             : POINT,
-            'Text'              : TEXT,
-            'Texture'           : TEXTURE,
-            'Utilities'         : UTILITIES,
-            'UV'                : UV,
-            'Vector'            : VECTOR_IMPL,
-            'Volume'            : VOLUME,
-            }
+        menu = NODE_MENUS
                     
         file_name = f"{folder}docs/api/nodes_menus.md"
         with open(file_name, 'w') as f:
@@ -1148,7 +1951,7 @@ class ClassGenerator(dict):
             
             file_name = f"{folder}docs/api/{blid}.md"
             with open(file_name, 'w') as f:
-                f.write(f"# Node *{wnode.bnode.name}*\n\n")
+                f.write(f"# Node *{wnode.blender_name}*\n\n")
                 
                 f.write(doc_header)
                 
@@ -1168,7 +1971,7 @@ class ClassGenerator(dict):
                 if len(classes) == 0:
                     if blid not in ['NodeFrame', 'GeometryNodeGroup', 'NodeReroute',
                                     'NodeGroupInput', 'NodeGroupOutput']:
-                        print(f"CAUTION: node not implemented in classes: {blid:35} {wnode.bnode.name}")
+                        print(f"CAUTION: node not implemented in classes: {blid:35} {wnode.blender_name}")
                     
                 else:
                     
@@ -1196,7 +1999,7 @@ class ClassGenerator(dict):
                             
                 
                 f.write("\n")
-                f.write(f"<sub>Go to [top](#node-{wnode.bnode.name.replace(' ', '-')}) - {nav_menu}</sub>\n\n")
+                f.write(f"<sub>Go to [top](#node-{wnode.blender_name.replace(' ', '-')}) - {nav_menu}</sub>\n\n")
                 
     # ----------------------------------------------------------------------------------------------------
     # Create the test file
@@ -3014,6 +3817,31 @@ ALL = {
        **V36,
        }
 
+# ----------------------------------------------------------------------------------------------------
+# Blender add menus
+
+NODE_MENUS = {
+    "Attribute"         : ATTRIBUTE,
+    'Color'             : COLOR,
+    'Curve'             : CURVE,
+    'Curve Primitives'  : CURVE_PRIMITIVES,
+    'Curve Topology'    : CURVE_TOPOLOGY,
+    'Geometry'          : GEOMETRY,
+    'Input'             : INPUT,
+    'Instances'         : INSTANCES,
+    'Material'          : MATERIAL,
+    'Mesh'              : MESH,
+    'Mesh Primitives'   : MESH_PRIMITIVES,
+    'Output'            : OUTPUT,
+    'Point'             : POINT,
+    'Text'              : TEXT,
+    'Texture'           : TEXTURE,
+    'Utilities'         : UTILITIES,
+    'UV'                : UV,
+    'Vector'            : VECTOR_IMPL,
+    'Volume'            : VOLUME,
+    }
+
 def get_class_generators(wnodes):
     cg = ClassGenerator(wnodes)
     cg.add_generators(ALL)
@@ -148,6 +148,9 @@ Step 3
 ------
     file nodes.py generation in folder geonodes.nodes
     
+    The node classes are written in one module per Blender menu (menu_mesh.py...). nodes.py
+    loads them on first access: nodes.Math imports menu_utilities.py.
+    
     The __init__ method of the node class is the concatenation of the input sockets and the settable parameters
     
     for instance, the __init__ method of ShaderNodeMath is:
@@ -206,14 +209,42 @@ Step 4
             
             Example: GeometryNodeBoundBox returns 3 infos on the geometry : bounding_box, min and max
 
+Node catalog
+------------
+    Steps 1 and 2 require Blender. What the node wrappers learnt can be exported in a catalog
+    file with export_catalog. Steps 3 and 4 can then be run in a plain python process
+    from the catalog with create_geonodes_from_catalog.
+
+Lean generation
+---------------
+    create_geonodes(..., lean=True) generates stub docstrings. The full documentation is written
+    in the file docstore.gnd and read on demand: geonodes.docstore.help(gn.Mesh.set_position)
+
+Introspection trace
+-------------------
+    create_geonodes(..., trace=fname) records per node the creation, parameters probing and
+    sockets exploration times, writes them in a json file and prints the slowest nodes.
+
 
 """
 
 from datetime import date
 import re
-
-import bpy
-import mathutils
+import ast
+import sys
+import json
+import time
+import hashlib
+import itertools
+
+try:
+    import bpy
+    import mathutils
+except ImportError:
+    # Outside Blender, the nodes are loaded from a catalog file (see load_catalog)
+    bpy       = None
+    mathutils = None
+    
 from pprint import pprint, pformat
 
 from generator import pyparser
@@ -249,6 +280,69 @@ def print_all_enums():
     print()
     for v in DATA_TYPE_TUPLES:
         print(v)
+        
+# ====================================================================================================
+# Enum items per node property
+#
+# - key   : (bl_idname, property name)
+# - value : tuple of the valid identifiers, None if the property is not an enum
+#
+# The items are read once from the RNA definition of the property: bl_rna.properties[name].enum_items.
+# The properties without static items (items built at run time) list their valid values
+# in the error raised when an invalid value is written: the list is read in the message
+# and each value is confirmed by writing it on the node.
+
+ENUM_TABLE = {}
+
+def enum_error_items(bnode, name):
+    
+    try:
+        setattr(bnode, name, 'ERROR')
+    except TypeError as e:
+        msg = str(e)
+        i = msg.find('enum "ERROR" not found in')
+        if i >= 0:
+            try:
+                return list(ast.literal_eval(msg[i + 26:].strip()))
+            except (ValueError, SyntaxError):
+                pass
+    return None
+
+def enum_items(bnode, name):
+    
+    key = (bnode.bl_idname, name)
+    if key in ENUM_TABLE:
+        return ENUM_TABLE[key]
+    
+    prop = bnode.bl_rna.properties.get(name)
+    if prop is None or prop.type != 'ENUM' or prop.is_enum_flag:
+        ENUM_TABLE[key] = None
+        return None
+    
+    items = [item.identifier for item in prop.enum_items]
+    
+    if len(prop.enum_items_static):
+        ENUM_TABLE[key] = tuple(items)
+        return ENUM_TABLE[key]
+    
+    # ----- No static items: values listed in the error message, confirmed by trial writes
+    
+    default    = getattr(bnode, name)
+    candidates = enum_error_items(bnode, name)
+    if candidates is None:
+        candidates = items
+    
+    values = []
+    for value in candidates:
+        try:
+            setattr(bnode, name, value)
+        except TypeError:
+            continue
+        values.append(value)
+    setattr(bnode, name, default)
+    
+    ENUM_TABLE[key] = tuple(values)
+    return ENUM_TABLE[key]
     
 
 # ====================================================================================================
@@ -261,6 +355,18 @@ DEPRECATED = {
     "ShaderNodeSeparateRGB",
     }
 
+# Abstract node classes, they can't be created in a tree
+
+NODE_BASES = {
+    "Node",
+    "NodeInternal",
+    "FunctionNode",
+    "GeometryNode",
+    "ShaderNode",
+    "CompositorNode",
+    "TextureNode",
+    }
+
 NODES_MENU = {
     
     # DEPRECATED
@@ -552,6 +658,17 @@ _indent_, _0_, _1_, _2_, _3_, _4_ = indent_set(0)
 def socket_name(blender_socket):
     return blender_socket.name #if blender_socket.label == "" else blender_socket.label
 
+# ====================================================================================================
+# Plain python value of a Blender property (to be written in the catalog)
+
+def plain_value(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    try:
+        return [plain_value(v) for v in value]
+    except TypeError:
+        return str(value)
+
 
 # ====================================================================================================
 # Call argument
@@ -584,6 +701,9 @@ def socket_name(blender_socket):
 
 
 class Argument:
+    
+    __slots__ = ('arg_type', 'name', 'label', 'is_self', 'ignore', 'wsocket', 'value', 'param', 'is_fixed', 'header_str', 'call_str')
+    
     def __init__(self, arg_type, name, is_self=False, label=None):
         self.arg_type = arg_type
         self.name     = name
@@ -611,7 +731,7 @@ class Argument:
         
         # Specific params
         
-        if isinstance(arg.value, (bpy.types.bpy_func, bpy.types.bpy_prop_collection)):
+        if param is not None and param.ignore:
             arg.ignore = True
         
         return arg
@@ -795,11 +915,103 @@ class Argument:
                 s += "*"
             return s + f"{self.wsocket.uname})"
         
+# ---------------------------------------------------------------------------
+# Hashable key from keyword arguments
+# Used to cache the results of methods called with the same kwargs
+
+def frozen_kwargs(kwargs):
+    
+    def freeze(value):
+        if isinstance(value, dict):
+            return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+        elif isinstance(value, (list, tuple)):
+            return tuple(freeze(v) for v in value)
+        elif isinstance(value, (set, frozenset)):
+            return tuple(sorted(freeze(v) for v in value))
+        try:
+            hash(value)
+            return value
+        except TypeError:
+            return repr(value)
+        
+    return freeze(kwargs)
+        
 # ---------------------------------------------------------------------------
 # A list of Arguments
+#
+# Once frozen, the list can't be changed and the results of method_header and
+# node_init_arguments are cached per kwargs
 
 class Arguments(list):
     
+    __slots__ = ('frozen', 'cache')
+    
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.frozen = False
+        self.cache  = None
+    
+    def freeze(self):
+        self.frozen  = True
+        self.cache   = {}
+        return self
+    
+    def check_frozen(self):
+        if self.frozen:
+            raise RuntimeError("Frozen arguments list can't be changed")
+            
+    def append(self, arg):
+        self.check_frozen()
+        super().append(arg)
+
+    def insert(self, index, arg):
+        self.check_frozen()
+        super().insert(index, arg)
+
+    def remove(self, arg):
+        self.check_frozen()
+        super().remove(arg)
+
+    def extend(self, args):
+        self.check_frozen()
+        super().extend(args)
+        
+    def pop(self, index=-1):
+        self.check_frozen()
+        return super().pop(index)
+        
+    def clear(self):
+        self.check_frozen()
+        super().clear()
+        
+    def sort(self, **kwargs):
+        self.check_frozen()
+        super().sort(**kwargs)
+        
+    def reverse(self):
+        self.check_frozen()
+        super().reverse()
+        
+    def __setitem__(self, index, arg):
+        self.check_frozen()
+        super().__setitem__(index, arg)
+        
+    def __delitem__(self, index):
+        self.check_frozen()
+        super().__delitem__(index)
+        
+    def __iadd__(self, args):
+        self.check_frozen()
+        return super().__iadd__(args)
+    
+    # ----- Cached result of a method
+    
+    def cached(self, method, kwargs):
+        if not self.frozen:
+            return None, None
+        key = (method, frozen_kwargs(kwargs))
+        return key, self.cache.get(key)
+    
     def add(self, arg):
         if arg.is_self or arg.is_cls:
             self.insert(0, arg)
@@ -864,7 +1076,7 @@ class Arguments(list):
             if not arg.is_socket:
                 continue
             
-            name = socket_name(arg.wsocket.bsocket)
+            name = arg.wsocket.bname
             if name in order:
                 reorder[order[name]] = arg
         
@@ -996,9 +1208,21 @@ class Arguments(list):
     
     # ----------------------------------------------------------------------------------------------------
     # Method header
+    #
+    # Returns a new list at each call since the caller can complete it
     
     def method_header(self, **kwargs):
         
+        key, vals = self.cached('method_header', kwargs)
+        if vals is None:
+            vals = self.build_method_header(**kwargs)
+            if key is not None:
+                self.cache[key] = vals
+                
+        return list(vals)
+    
+    def build_method_header(self, **kwargs):
+        
         vals = []
         
         # ----- RULE 2 - extract the arg_rename dict
@@ -1044,6 +1268,16 @@ class Arguments(list):
     
     def node_init_arguments(self, **kwargs):
         
+        key, s = self.cached('node_init_arguments', kwargs)
+        if s is None:
+            s = self.build_node_init_arguments(**kwargs)
+            if key is not None:
+                self.cache[key] = s
+                
+        return s
+    
+    def build_node_init_arguments(self, **kwargs):
+        
         vals = []
         
         # ----- RULE 1 - extract the arg_rename dict
@@ -1142,12 +1376,25 @@ class WSocket:
         'Color'     : 'FLOAT_COLOR',
         'Boolean'   : 'BOOLEAN'
     }
+    
+    __slots__ = ('bsocket', 'index', 'bl_idname', 'bname', 'name', 'is_multi_input', 'is_output', 'display_shape',
+                 'uname', 'class_name', 'domain_data_type')
 
     def __init__(self, bsocket, index):
         self.bsocket    = bsocket
         self.index      = index
+        
+        # Static properties are read once: they don't depend on the node parameters
+        
+        self.bl_idname      = sys.intern(bsocket.bl_idname)
+        self.bname          = sys.intern(socket_name(bsocket))
+        self.name           = WSocket.python_name(self.bname)
+        self.is_multi_input = bsocket.is_multi_input
+        self.is_output      = bsocket.is_output
+        self.display_shape  = bsocket.display_shape
+        
         self.uname      = self.name
-        self.class_name = WSocket.SOCKET_CLASSES[self.bsocket.bl_idname][0]
+        self.class_name = WSocket.SOCKET_CLASSES[self.bl_idname][0]
         self.domain_data_type = WSocket.DOMAIN_DATA_TYPES.get(self.class_name)
         if self.class_name == 'Geometry':
             if self.name.lower() in ['mesh', 'points', 'instances', 'volume', 'curve']:
@@ -1160,38 +1407,62 @@ class WSocket:
         return f"<{self.uname} ({self.class_name})>"
     
     @staticmethod
-    def domain_data_type(bl_idname):
+    def socket_data_type(bl_idname):
         return WSocket.SOCKET_CLASSES[bl_idname][2]
     
-    @property
-    def bl_idname(self):
-        return self.bsocket.bl_idname
-        
     @property
     def enabled(self):
         return self.bsocket.enabled
     
-    @property
-    def name(self):
-        s = socket_name(self.bsocket).lower().replace(' ', '_').replace('-', '_')
+    # ----- Python name from the Blender socket name
+    
+    @staticmethod
+    def python_name(bname):
+        s = bname.lower().replace(' ', '_').replace('-', '_')
         if s == 'id':
             return 'ID'
         else:
-            return s
-    
-    @property
-    def is_multi_input(self):
-        return self.bsocket.is_multi_input
+            return sys.intern(s)
+        
+    # ----------------------------------------------------------------------------------------------------
+    # Catalog
+    
+    def to_dict(self):
+        return {
+            'index'            : self.index,
+            'name'             : self.bname,
+            'uname'            : self.uname,
+            'bl_idname'        : self.bl_idname,
+            'class_name'       : self.class_name,
+            'domain_data_type' : self.domain_data_type,
+            'is_multi_input'   : self.is_multi_input,
+            'is_output'        : self.is_output,
+            'display_shape'    : self.display_shape,
+            }
     
-    @property
-    def is_output(self):
-        return self.bsocket.is_output
+    @classmethod
+    def FromDict(cls, data):
+        wsock = cls.__new__(cls)
+        wsock.bsocket          = None
+        wsock.index            = data['index']
+        wsock.bname            = sys.intern(data['name'])
+        wsock.name             = WSocket.python_name(wsock.bname)
+        wsock.uname            = sys.intern(data['uname'])
+        wsock.bl_idname        = sys.intern(data['bl_idname'])
+        wsock.class_name       = sys.intern(data['class_name'])
+        wsock.domain_data_type = data['domain_data_type']
+        wsock.is_multi_input   = data['is_multi_input']
+        wsock.is_output        = data['is_output']
+        wsock.display_shape    = data['display_shape']
+        return wsock
     
 # ---------------------------------------------------------------------------
 # A list of WSockets
 
 class WSockets(list):
     
+    __slots__ = ('bsockets', 'unames', 'drivers', 'unames_indices')
+    
     def __init__(self, bsockets):
         super().__init__()
         self.bsockets = bsockets
@@ -1224,11 +1495,11 @@ class WSockets(list):
                 self.unames[name] = wsocks[0]
             else:
                 class_name    = wsocks[0].class_name
-                display_shape = wsocks[0].bsocket.display_shape
+                display_shape = wsocks[0].display_shape
                 distinction   = 'HOMONYMS'
                 
                 for wsock in wsocks:
-                    if (wsock.class_name != class_name) or (wsock.bsocket.display_shape != display_shape):
+                    if (wsock.class_name != class_name) or (wsock.display_shape != display_shape):
                         self.unames[wsock.name] = wsocks
                         distinction = 'SHARED'
                         break
@@ -1237,22 +1508,23 @@ class WSockets(list):
                     if wsocks[0].is_output:
                         raise RuntimeError("Big mistake !!!")
                     for i, wsock in enumerate(wsocks):
-                        wsock.uname = f"{name}{i}"
+                        wsock.uname = sys.intern(f"{name}{i}")
                         self.unames[wsock.uname] = wsock
                         
-        # ----- unames indices
-        # - key     : the unique name
-        # - value   : a dictionay giving the socket index from the driving
-        #             parameter value
-        # Initialized by the owner node by making vary the driving parameter
-        # and by calling the method update_unames_indices
+        # ----- Shared sockets drivers and indices
+        # - drivers        : key   = the unique name of shared sockets
+        #                    value = tuple of the parameters driving which socket is enabled
+        # - unames_indices : key   = the unique name of shared sockets
+        #                    value = a dictionary giving the socket index from the values
+        #                            of the driving parameters
+        # Initialized by the owner node from its enablement table (see set_drivers)
         #
         # Example:
-        # unames_indices = {'from_value': {'FLOAT': 0, 'VECTOR': 2}, 'to_value': {'FLOAT': 1, 'VECTOR' : 3}}
+        # drivers        = {'attribute': ('data_type',)}
+        # unames_indices = {'attribute': {('FLOAT',): 1, ('FLOAT_VECTOR',): 2, ...}}
 
+        self.drivers        = {}
         self.unames_indices = {}
-        for uname in self.unames:
-            self.unames_indices[uname] = {}
             
     # ----------------------------------------------------------------------------------------------------
     # The sockets which are shared according a driving parameter                 
@@ -1266,16 +1538,72 @@ class WSockets(list):
         return sel
     
     # ----------------------------------------------------------------------------------------------------
-    # The node makes vary the driving parameter. At each change, it calls the following
-    # method to update the unames_indices dictionary
+    # Drivers of the shared sockets
+    #
+    # The node gives its enablement table (see WNode.explore_enablement):
+    # - sweep_params : the parameters in the table key
+    # - table        : key = values of the sweep parameters, value = enabled bits of the sockets
+    #
+    # A parameter drives a shared uname if changing only its value changes the enabled state
+    # of one of the sockets sharing the uname. The socket indices are then given by the
+    # values of the driving parameters only.
+        
+    def set_drivers(self, sweep_params, table):
+        
+        pos = {id(wsock): i for i, wsock in enumerate(self)}
+        
+        self.drivers        = {}
+        self.unames_indices = {}
         
-    def update_unames_indices(self, param_value):
         for uname, wsocks in self.shared_sockets.items():
+            
+            mask = 0
             for wsock in wsocks:
-                if wsock.enabled:
-                    if self.unames_indices[uname].get(param_value) is not None:
-                        raise RuntimeError("Unconsistant, really !")
-                    self.unames_indices[uname][param_value] = wsock.index
+                mask |= 1 << pos[id(wsock)]
+                
+            # ----- Parameters changing the enabled sockets
+                
+            drivers = []
+            for i, name in enumerate(sweep_params):
+                if WSockets.drives(table, i, mask):
+                    drivers.append(name)
+            
+            # ----- Socket indices from the drivers values
+                    
+            inds = [sweep_params.index(name) for name in drivers]
+            indices = {}
+            for values, bits in table.items():
+                key = tuple(values[i] for i in inds)
+                for wsock in wsocks:
+                    if bits & (1 << pos[id(wsock)]):
+                        if indices.get(key, wsock.index) != wsock.index:
+                            raise RuntimeError(f"Unconsistant enablement of shared socket '{uname}' for {dict(zip(drivers, key))}")
+                        indices[key] = wsock.index
+                        break
+                
+            self.drivers[uname]        = tuple(drivers)
+            self.unames_indices[uname] = indices
+            
+    @staticmethod
+    def drives(table, i, mask):
+        for values, bits in table.items():
+            for other_values, other_bits in table.items():
+                if ((bits ^ other_bits) & mask) == 0:
+                    continue
+                if values[:i] == other_values[:i] and values[i+1:] == other_values[i+1:]:
+                    return True
+        return False
+    
+    # ----------------------------------------------------------------------------------------------------
+    # Indices of a shared uname which can be enabled
+    # All the sockets if the enablement is unknown
+    
+    def shared_indices(self, uname):
+        indices = set(self.unames_indices.get(uname, {}).values())
+        wsocks = self.unames[uname]
+        if not indices:
+            return [wsock.index for wsock in wsocks]
+        return [wsock.index for wsock in wsocks if wsock.index in indices]
     
 
     # ----------------------------------------------------------------------------------------------------
@@ -1288,6 +1616,16 @@ class WSockets(list):
                 wsockets.append(wsock)
         return wsockets
     
+    # ----------------------------------------------------------------------------------------------------
+    # Currently enabled sockets as a bitset: bit i is set if self[i] is enabled
+    
+    def enabled_bits(self):
+        bits = 0
+        for i, wsock in enumerate(self):
+            if wsock.enabled:
+                bits |= 1 << i
+        return bits
+    
     # ====================================================================================================
     # Output sockets indices
     # Used to build the output_sockets property of the generated class
@@ -1296,21 +1634,69 @@ class WSockets(list):
         inds = {}
         for uname, wsocks in self.unames.items():
             if isinstance(wsocks, list):
-                index = self.unames[uname][fixed[self.driving_param]]
+                index = self.unames_indices[uname].get(tuple(fixed[name] for name in self.drivers[uname]))
             else:
                 index = wsocks.index
             inds[uname] = index
         return inds
     
+    # ====================================================================================================
+    # Catalog
+    #
+    # The sockets are referenced by their position in the list, the unames entries
+    # are either a position or a list of positions for shared sockets.
+    # The unames indices are given as a list of [driving values, index]
+    
+    def to_dict(self):
+        
+        pos = {id(wsock): i for i, wsock in enumerate(self)}
+        
+        unames = {}
+        for uname, wsocks in self.unames.items():
+            if isinstance(wsocks, list):
+                unames[uname] = [pos[id(wsock)] for wsock in wsocks]
+            else:
+                unames[uname] = pos[id(wsocks)]
+        
+        return {
+            'sockets'        : [wsock.to_dict() for wsock in self],
+            'unames'         : unames,
+            'drivers'        : {uname: list(drivers) for uname, drivers in self.drivers.items()},
+            'unames_indices' : {uname: [[list(key), index] for key, index in indices.items()] for uname, indices in self.unames_indices.items()},
+            }
+    
+    @classmethod
+    def FromDict(cls, data):
+        
+        wsockets = cls.__new__(cls)
+        wsockets.bsockets = None
+        for sock_data in data['sockets']:
+            wsockets.append(WSocket.FromDict(sock_data))
+            
+        wsockets.unames = {}
+        for uname, pos in data['unames'].items():
+            if isinstance(pos, list):
+                wsockets.unames[uname] = [wsockets[i] for i in pos]
+            else:
+                wsockets.unames[uname] = wsockets[pos]
+                
+        wsockets.drivers        = {uname: tuple(drivers) for uname, drivers in data['drivers'].items()}
+        wsockets.unames_indices = {uname: {tuple(key): index for key, index in indices} for uname, indices in data['unames_indices'].items()}
+        
+        return wsockets
+    
     
 # ====================================================================================================
 # A parameter wrapper
 
 class Parameter:
+    
+    __slots__ = ('wnode', 'name', 'uname', 'is_enum', 'default', 'param_type', 'ignore', 'values')
+    
     def __init__(self, wnode, name):
         self.wnode   = wnode
-        self.name    = name
-        self.uname   = name
+        self.name    = sys.intern(name)
+        self.uname   = self.name
 
         self.is_enum    = False  # The parameter value is chosen in an enum list : self.values
         self.default    = self.value
@@ -1321,17 +1707,16 @@ class Parameter:
         elif isinstance(self.default, mathutils.Vector):
             self.default = list(self.default)
             
+        # Functions and collections are not settable at creation time
+            
+        self.ignore = isinstance(self.default, (bpy.types.bpy_func, bpy.types.bpy_prop_collection))
+            
         if isinstance(self.default, str):
-            try:
-                setattr(self.wnode.bnode, self.name, 'ERROR')
-                #self.value = 'ERROR'
-            except TypeError as e:
-                msg = str(e)
-                i = msg.find('enum "ERROR" not found in')
-                self.is_enum = i > 0
-                if self.is_enum:
-                    self.values = eval(msg[i+26:])
-                    add_enum_list(name, self.values)
+            values = enum_items(self.wnode.bnode, self.name)
+            self.is_enum = values is not None
+            if self.is_enum:
+                self.values = values
+                add_enum_list(name, self.values)
                     
                     
         # ----- Some hack :-( 
@@ -1343,6 +1728,38 @@ class Parameter:
         vals = str(self.values) if self.is_enum else self.default
         return f"<WNode Parameter {self.name} ({self.uname}): {vals}>"
     
+    # ----------------------------------------------------------------------------------------------------
+    # Catalog
+    
+    def to_dict(self):
+        data = {
+            'name'       : self.name,
+            'uname'      : self.uname,
+            'default'    : plain_value(self.default),
+            'param_type' : self.param_type,
+            'is_enum'    : self.is_enum,
+            'ignore'     : self.ignore,
+            }
+        if hasattr(self, 'values'):
+            data['values'] = list(self.values)
+        return data
+    
+    @classmethod
+    def FromDict(cls, wnode, data):
+        param = cls.__new__(cls)
+        param.wnode      = wnode
+        param.name       = sys.intern(data['name'])
+        param.uname      = sys.intern(data['uname'])
+        param.default    = data['default']
+        param.param_type = data['param_type']
+        param.is_enum    = data['is_enum']
+        param.ignore     = data['ignore']
+        if 'values' in data:
+            param.values = tuple(data['values'])
+            if param.is_enum:
+                add_enum_list(param.name, param.values)
+        return param
+    
     @property
     def sdefault(self):
         if isinstance(self.default, str):
@@ -1401,20 +1818,27 @@ class WNode:
        
        ]
     
-    def __init__(self, bnode):
+    __slots__ = ('bnode', 'bl_idname', 'blender_name', 'node_name', 'function_name', 'signature',
+                 'inputs', 'outputs', 'parameters', 'has_shared_sockets', 'driving_params',
+                 'sweep_params', 'enablement', 'data_sockets', 'node_arguments')
+    
+    def __init__(self, bnode, signature=None):
         
         #print("NODE bl_idname", bnode.bl_idname)
         
         WNode.WNODES[bnode.bl_idname] = self
         
-        self.bnode   = bnode
-        self.inputs  = WSockets(self.bnode.inputs)
-        self.outputs = WSockets(self.bnode.outputs)
+        self.bnode        = bnode
+        self.bl_idname    = sys.intern(bnode.bl_idname)
+        self.set_names(bnode.name)
+        self.signature    = node_signature(bnode) if signature is None else signature
+        self.inputs       = WSockets(self.bnode.inputs)
+        self.outputs      = WSockets(self.bnode.outputs)
         
         # Output geometry sockets class name can be defined by its name
         # But some socket names need specifif setting
         
-        geo_classes = OUTPUT_SOCKETS_CLASS.get(self.bnode.bl_idname, {})
+        geo_classes = OUTPUT_SOCKETS_CLASS.get(self.bl_idname, {})
         for wsock in self.outputs:
             class_name = geo_classes.get(wsock.name, None)
             if class_name is not None:
@@ -1422,6 +1846,8 @@ class WNode:
                 
         # Parameters
         
+        t0 = time.perf_counter()
+        
         self.parameters = {}
         for param_name in dir(self.bnode):
             
@@ -1445,31 +1871,27 @@ class WNode:
                 if param_name in self.outputs.unames:
                     self.parameters[param_name].uname = param_name + '_'
                     
+        # ----- Enabled sockets per combination of the enum parameters
+        
+        t1 = time.perf_counter()
+        sweeps = self.explore_enablement()
+        
+        if TRACE is not None:
+            TRACE.explored(self, probe=t1 - t0, sweeps=sweeps, sweep_time=time.perf_counter() - t1)
+                
         # ----- shared sockets : a unique name is shared between several sockets
+        # The parameters driving the shared sockets are read in the enablement table
                     
         self.has_shared_sockets = bool(self.inputs.shared_sockets) or bool(self.outputs.shared_sockets)
-        
-        if self.has_shared_sockets:
-            self.driving_param = 'input_type' if hasattr(self.bnode, 'input_type') else 'data_type'
-            
-            # hacks
-            if bnode.bl_idname == 'GeometryNodeSampleVolume':
-                self.driving_param = 'interpolation_mode'
-            
-            try:
-                param = self.parameters[self.driving_param]
-            except:
-                raise Exception(f"Impossible de get the driving parameter of '{bnode.bl_idname}'. '{param}' fails. Parameters are {self.parameters}")
-            
-            
-            for value in param.values:
-                param.value = value
-                self.inputs.update_unames_indices(value)
-                self.outputs.update_unames_indices(value)
+        self.set_drivers()
                 
         # ----- Data sockets calling this node
         
         self.data_sockets = {}
+        
+        # ----- Arguments built on demand by get_node_arguments
+        
+        self.node_arguments = None
                 
 
     def __str__(self):
@@ -1481,23 +1903,84 @@ class WNode:
             self.data_sockets[class_name] = [(name, family)]
         else:
             lst.append((name, family))
+            
+    # ----------------------------------------------------------------------------------------------------
+    # Catalog
+    #
+    # Everything the wrapper learnt from the Blender node is exported in a dictionary
+    # made of python values. The enabled sockets (which require a live Blender node
+    # to be computed) are exported for the default parameters.
+    
+    def to_dict(self):
+        return {
+            'bl_idname'          : self.bl_idname,
+            'name'               : self.blender_name,
+            'signature'          : self.signature,
+            'inputs'             : self.inputs.to_dict(),
+            'outputs'            : self.outputs.to_dict(),
+            'parameters'         : [param.to_dict() for param in self.parameters.values()],
+            'has_shared_sockets' : self.has_shared_sockets,
+            'driving_params'     : list(self.driving_params),
+            'sweep_params'       : self.sweep_params,
+            'enablement'         : [[list(values), in_bits, out_bits] for values, (in_bits, out_bits) in self.enablement.items()],
+            }
+    
+    @classmethod
+    def FromDict(cls, data):
+        
+        wnode = cls.__new__(cls)
+        WNode.WNODES[data['bl_idname']] = wnode
+        
+        wnode.bnode              = None
+        wnode.bl_idname          = sys.intern(data['bl_idname'])
+        wnode.set_names(data['name'])
+        wnode.signature          = data['signature']
+        wnode.inputs             = WSockets.FromDict(data['inputs'])
+        wnode.outputs            = WSockets.FromDict(data['outputs'])
+        wnode.parameters         = {}
+        for param_data in data['parameters']:
+            wnode.parameters[param_data['name']] = Parameter.FromDict(wnode, param_data)
+        wnode.has_shared_sockets = data['has_shared_sockets']
+        wnode.driving_params     = tuple(data['driving_params'])
+        wnode.sweep_params       = data['sweep_params']
+        wnode.enablement         = {tuple(values): (in_bits, out_bits) for values, in_bits, out_bits in data['enablement']}
+        wnode.data_sockets       = {}
+        wnode.node_arguments     = None
+        
+        return wnode
+    
+    # ----------------------------------------------------------------------------------------------------
+    # Detach the wrapper from the Blender node
+    #
+    # Once detached, the wrapper is plain python data: it can be pickled or cached.
+    
+    def detach(self):
         
-        
-    @property
-    def bl_idname(self):
-        return self.bnode.bl_idname
+        self.bnode = None
+        for wsockets in (self.inputs, self.outputs):
+            wsockets.bsockets = None
+            for wsock in wsockets:
+                wsock.bsocket = None
+
+    # ----------------------------------------------------------------------------------------------------
+    # Names derived from the Blender name are computed once
     
-    @property
-    def node_name(self):
+    def set_names(self, blender_name):
+        self.blender_name  = sys.intern(blender_name)
+        self.node_name     = sys.intern(WNode.get_node_name(blender_name))
+        self.function_name = sys.intern(WNode.get_function_name(blender_name))
+        
+    @staticmethod
+    def get_node_name(blender_name):
         
         # ----- Some hacks
         
-        if self.bnode.name == "ColorRamp":
+        if blender_name == "ColorRamp":
             return "ColorRamp"
         
         # ----- Standard
         
-        words = self.bnode.name.split(' ')
+        words = blender_name.split(' ')
         s = ""
         for word in words:
             if word.lower() == 'id':
@@ -1507,17 +1990,17 @@ class WNode:
         return s
         #return "Node" + s
     
-    @property
-    def function_name(self):
+    @staticmethod
+    def get_function_name(blender_name):
 
         # ----- Some hacks
         
-        if self.bnode.name == "ColorRamp":
+        if blender_name == "ColorRamp":
             return "color_ramp"
         
         # ----- Standard
 
-        words = self.bnode.name.split(' ')
+        words = blender_name.split(' ')
         s = ""
         for word in words:
             w = word.lower()
@@ -1533,7 +2016,7 @@ class WNode:
     
     @property
     def blender_ref_name(self):
-        return self.bnode.name.lower().replace(' ', '_')
+        return self.blender_name.lower().replace(' ', '_')
     
     @property
     def blender_ref_menu(self):
@@ -1557,7 +2040,7 @@ class WNode:
     
     @property
     def node_image_ref(self):
-        return f"https://docs.blender.org/manual/en/latest/_images/node-types_{self.bnode.bl_idname}.webp"        
+        return f"https://docs.blender.org/manual/en/latest/_images/node-types_{self.bl_idname}.webp"        
     
     # ---------------------------------------------------------------------------
     # Set parameters
@@ -1579,15 +2062,54 @@ class WNode:
     def non_driving_params(self):
         params = {}
         for name, param in self.parameters.items():
-            if name == self.driving_param:
+            if name in self.driving_params:
                 continue
-            params[name] = Parameter(self, name)
+            params[name] = param
         return params
     
+    # ----------------------------------------------------------------------------------------------------
+    # Parameters driving the shared sockets
+    
+    def set_drivers(self):
+        
+        for which, wsockets in enumerate((self.inputs, self.outputs)):
+            table = {values: state[which] for values, state in self.enablement.items()}
+            wsockets.set_drivers(self.sweep_params, table)
+            
+        drivers = set()
+        for wsockets in (self.inputs, self.outputs):
+            for names in wsockets.drivers.values():
+                drivers.update(names)
+                
+        self.driving_params = tuple(name for name in self.parameters if name in drivers)
+        
+    # ----------------------------------------------------------------------------------------------------
+    # Documentation of the shared sockets
+    # fmt is used to decorate the parameter names
+    
+    @staticmethod
+    def dependant_str(drivers, fmt="{}"):
+        if not drivers:
+            return "shared"
+        return ", ".join([fmt.format(name) for name in drivers]) + " dependant"
+    
+    def driving_params_str(self, fmt="{}"):
+        label = "Driving parameter" if len(self.driving_params) <= 1 else "Driving parameters"
+        return f"{label} : " + ", ".join([f"{fmt.format(name)} in {self.parameters[name].values}" for name in self.driving_params])
+    
     # ----------------------------------------------------------------------------------------------------
     # Node arguments
+    #
+    # The arguments only depend on the input sockets and on the parameters defaults:
+    # they are built once and frozen
     
     def get_node_arguments(self):
+        
+        if self.node_arguments is None:
+            self.node_arguments = self.build_node_arguments().freeze()
+        return self.node_arguments
+    
+    def build_node_arguments(self):
 
         args = Arguments()
         for uname, wsock in self.inputs.unames.items():
@@ -1600,46 +2122,135 @@ class WNode:
             
         return args
     
+    # ====================================================================================================
+    # Enablement table
+    #
+    # The enabled sockets are explored once per node and stored in a table:
+    # - sweep_params : the enum parameters which change the enabled sockets
+    # - enablement   : key   = tuple of values of the sweep parameters
+    #                  value = (inputs bits, outputs bits) as given by WSockets.enabled_bits
+    #
+    # The enum parameters which don't change the enabled sockets are pruned from the table.
+    # A parameter can have an effect only in combination with another one (mode of Compare
+    # has an effect only for data_type 'VECTOR'): a parameter is pruned only if it has no effect
+    # for all the combinations of the sweep parameters.
+    
+    # Returns the number of parameters combinations applied to the node
+    
+    def explore_enablement(self):
+        
+        enums = [param for param in self.parameters.values() if param.is_enum]
+        sweeps = 0
+        
+        def reset():
+            for param in enums:
+                param.reset()
+        
+        # ----- Set parameters values, returns False if one the values is refused by the node
+        
+        def apply(names, values):
+            nonlocal sweeps
+            sweeps += 1
+            for name, value in zip(names, values):
+                self.parameters[name].value = value
+            for name, value in zip(names, values):
+                if self.parameters[name].value != value:
+                    return False
+            return True
+        
+        # ----- Table for the given sweep parameters
+        
+        def sweep(names):
+            table = {}
+            for values in itertools.product(*[self.parameters[name].values for name in names]):
+                reset()
+                if apply(names, values):
+                    table[values] = (self.inputs.enabled_bits(), self.outputs.enabled_bits())
+            return table
+        
+        # ----- Does the parameter change the enabled sockets for one of the combinations
+        
+        def has_effect(param, names, table):
+            for values, state in table.items():
+                for value in param.values:
+                    reset()
+                    apply(names, values)
+                    if not apply([param.name], [value]):
+                        continue
+                    if (self.inputs.enabled_bits(), self.outputs.enabled_bits()) != state:
+                        return True
+            return False
+        
+        # ----- Add sweep parameters until the other ones have no effect
+        
+        names = []
+        table = sweep(names)
+        
+        ok_change = True
+        while ok_change:
+            ok_change = False
+            for param in enums:
+                if param.name in names:
+                    continue
+                if has_effect(param, names, table):
+                    names = [name for name in self.parameters if name in names or name == param.name]
+                    table = sweep(names)
+                    ok_change = True
+                    break
+                
+        reset()
+        
+        self.sweep_params = names
+        self.enablement   = table
+        
+        return sweeps
+        
+    # ----------------------------------------------------------------------------------------------------
+    # Enabled sockets bits in the table
+    # Returns 0 if the combination is not valid
+    
+    def enablement_bits(self, wsockets, values):
+        state = self.enablement.get(tuple(values))
+        if state is None:
+            return 0
+        return state[0] if wsockets is self.inputs else state[1]
+        
     # ====================================================================================================
     # Enabled sockets with the fixed parameters
     # makes the free parameters vary to check which sockets to use
+    #
+    # Read in the enablement table:
+    # - sockets enabled with the fixed parameters, the other ones being at their default value
+    # - plus the sockets enabled when changing one of the free enum parameters
     
     def sockets_unames(self, wsockets, fixed={}):
-    
-        self.set_params(fixed)
         
-        ens = [wsock.enabled for wsock in wsockets]
-        for name, param in self.parameters.items():
+        values = []
+        for name in self.sweep_params:
+            param = self.parameters[name]
+            value = fixed.get(name, param.default)
+            values.append(value if value in param.values else param.default)
+            
+        bits = self.enablement_bits(wsockets, values)
+        for i, name in enumerate(self.sweep_params):
             if name in fixed:
                 continue
-            if not param.is_enum:
-                continue
-            
-            # ----- Reload the enum values to explore the possibilities
-            
-            new_param = Parameter(self, name)
-            for value in new_param.values:
-                param.value = value
-                for i, wsock in enumerate(wsockets):
-                    if wsock.enabled:
-                        ens[i] = True
-            new_param.value = new_param.default
+            for value in self.parameters[name].values:
+                bits |= self.enablement_bits(wsockets, values[:i] + [value] + values[i+1:])
+                
+        ens = [bool(bits & (1 << i)) for i in range(len(wsockets))]
         
         # ----- Let's keep only the outputs which can be enabled
-        
-        self.set_params(fixed)
 
-        fixed_shared = True
-        if self.has_shared_sockets:
-            fixed_shared = self.driving_param in fixed
-                
         unames = {}
         for i, wsock in enumerate(wsockets):
             if ens[i] and (wsock.uname not in unames):
+                drivers = wsockets.drivers.get(wsock.uname, ())
+                fixed_shared = all([name in fixed for name in drivers])
                 if fixed_shared or wsock.uname not in wsockets.shared_sockets:
                     unames[wsock.uname] = wsock.class_name
                 else:
-                    unames[wsock.uname] = f"{self.driving_param} dependant"
+                    unames[wsock.uname] = self.dependant_str(drivers)
                     
         return unames
 
@@ -1703,7 +2314,7 @@ class WNode:
                     continue
                 
                 if s == "":
-                    sbl = f"'{self.bnode.bl_idname}'"
+                    sbl = f"'{self.bl_idname}'"
                     s = f"{sbl:42s} : " + "{"
                 sn = f"'{wsock.uname}'"
                 s += f"{sn:17s} : '{wsock.class_name}'" + ","
@@ -1729,8 +2340,8 @@ class WNode:
         section.id = self.node_name
         
         section.set_text(f"""
-        > Geometry node name: [{self.bnode.name}]({self.blender_ref})<br>
-        > Blender type: [{self.bnode.name}]({self.blender_python_ref})
+        > Geometry node name: [{self.blender_name}]({self.blender_ref})<br>
+        > Blender type: [{self.blender_name}]({self.blender_python_ref})
         
         <sub>go to [index](ref:index)</sub>
         
@@ -1754,7 +2365,7 @@ class WNode:
             for uname, wsock in self.inputs.unames.items():
                 
                 if isinstance(wsock, list):
-                    sval = f"{self.driving_param} dependant"
+                    sval = self.dependant_str(self.inputs.drivers[uname])
                 elif wsock.is_multi_input:
                     sval = f"<m> {wsock.class_name}"
                 else:
@@ -1797,7 +2408,7 @@ class WNode:
             new_section = Section(section, "Data type dependant sockets")
             new_section.set_text(f"""
                                  
-            - Driving parameter : {self.driving_param} in {self.parameters[self.driving_param].values}
+            - {self.driving_params_str()}
             - Input sockets  : {list(self.inputs.shared_sockets.keys())}
             - Output sockets : {list(self.outputs.shared_sockets.keys())}   
                               
@@ -1810,7 +2421,7 @@ class WNode:
             for uname, wsock in self.outputs.unames.items():
                 
                 if isinstance(wsock, list):
-                    sval = f"{self.driving_param} dependant"
+                    sval = self.dependant_str(self.outputs.drivers[uname])
                 else:
                     sval = wsock.class_name
                     if wsock.is_multi_input:
@@ -1852,7 +2463,7 @@ class WNode:
         yield f"- [Blender reference]({self.blender_ref})\n"
         yield f"- [api reference]({self.blender_python_ref})\n"
         yield f"- geonodes name: `{self.node_name}`\n"
-        yield f"- bl_idname: `{self.bnode.bl_idname}`\n\n"
+        yield f"- bl_idname: `{self.bl_idname}`\n\n"
         
         yield "```python\n"
         yield "from geonodes import nodes\n\n"
@@ -1880,7 +2491,7 @@ class WNode:
             yield f"- **{uname}**: "
             
             if isinstance(wsock, list):
-                yield f"**{self.driving_param}** dependant"
+                yield self.dependant_str(self.inputs.drivers[uname], "**{}**")
                 
             elif wsock.is_multi_input:
                 yield f"*[{wsock.class_name}]({wsock.class_name}.md)"
@@ -1930,7 +2541,7 @@ class WNode:
             for uname, wsock in self.outputs.unames.items():
                 
                 if isinstance(wsock, list):
-                    sval = f"``{self.driving_param}`` dependant"
+                    sval = self.dependant_str(self.outputs.drivers[uname], "``{}``")
                 else:
                     sval = f"[{wsock.class_name}]({wsock.class_name}.md)"
                         
@@ -1945,44 +2556,191 @@ class WNode:
             
             yield "#### Shared sockets:\n\n"
             
-            yield f"- Driving parameter : ``{self.driving_param}`` in {self.parameters[self.driving_param].values}\n"
+            yield f"- {self.driving_params_str('``{}``')}\n"
             yield f"- Input sockets  : {list(self.inputs.shared_sockets.keys())}\n"
             yield f"- Output sockets : {list(self.outputs.shared_sockets.keys())}\n"
     
 
     # ====================================================================================================
-    # Generate the node class
+    # Sockets tables
+    #
+    # uname: index, or uname: [indices] for shared sockets
     
-    def gen_node_class(self, wrap_parameters=True, cl_gen=None):
-        
-        args = self.get_node_arguments()
-        
-        # ---------------------------------------------------------------------------
-        # Class header
-        #
-        # class NodeMath(Node):
-        
-        yield _0_ + f"class {self.node_name}(Node):\n"
+    def sockets_table(self, wsockets):
+        table = {}
+        for uname, wsocks in wsockets.unames.items():
+            if isinstance(wsocks, list):
+                table[uname] = wsockets.shared_indices(uname)
+            else:
+                table[uname] = wsocks.index
+        return table
     
-        # ---------------------------------------------------------------------------
-        # Class comment
-        
-        yield _1_ + '"""' + f"Node *{self.bnode.name}*\n"
-        yield _1_ + f".. _{self.node_name}:\n"
-        
-        # ---- Classes calling this node
+    # ----------------------------------------------------------------------------------------------------
+    # Output sockets properties with the index resolved at generation time
+    #
+    # - plain socket          : return self.output_socket(index, 'name')
+    # - shared socket         : the index is read in a class table keyed by the values of the
+    #                           driving parameters, for instance for a single driver:
+    #
+    #   _OUT_ATTRIBUTE = MappingProxyType({'FLOAT': 2, 'INT': 3, ...})
+    #
+    #   @property
+    #   def attribute(self):
+    #       index = self._OUT_ATTRIBUTE.get(self.bnode.data_type)
+    #       return self.get_output_socket('attribute') if index is None else self.output_socket(index, 'attribute')
+    #
+    # The name resolution get_output_socket is kept when the enablement is unknown or
+    # for a combination of values not in the table.
+    # output_socket wraps bnode.outputs[index] in the class _OUT_CLASSES[index] (see package_init_source)
+    
+    def gen_output_properties(self):
         
-        if cl_gen is not None:
-            node_ref = cl_gen.get(self.bl_idname)
-            if node_ref is None:
-                pass
-                #print(f"CAUTION: node {self.bl_idname} not implemented in class generators")
+        for name, wsocks in self.outputs.unames.items():
+            
+            yield _1_ + "@property"
+            yield _1_ + f"def {name}(self):"
+            
+            if not isinstance(wsocks, list):
+                yield _2_ + f"return self.output_socket({wsocks.index}, '{name}')\n"
+                continue
+                
+            drivers = self.outputs.drivers.get(name, ())
+            indices = self.outputs.unames_indices.get(name, {})
+            
+            if not indices:
+                yield _2_ + f"return self.get_output_socket('{name}')\n"
+                
+            elif not drivers:
+                yield _2_ + f"return self.output_socket({indices[()]}, '{name}')\n"
                 
             else:
-                yield _1_ + "Node implementation:"
-                for class_name, gs in node_ref.items():
-                    if class_name == 'functions':
-                        yield _2_ + 'global functions:'
+                table = f"_OUT_{name.upper()}"
+                if len(drivers) == 1:
+                    yield _2_ + f"index = self.{table}.get(self.bnode.{drivers[0]})"
+                else:
+                    skey = ", ".join([f"self.bnode.{driver}" for driver in drivers])
+                    yield _2_ + f"index = self.{table}.get(({skey}))"
+                yield _2_ + f"return self.get_output_socket('{name}') if index is None else self.output_socket(index, '{name}')\n"
+                
+    # ----------------------------------------------------------------------------------------------------
+    # Class tables of the shared output sockets indices used by the properties
+                
+    def gen_output_indices_tables(self):
+        
+        for name, wsocks in self.outputs.unames.items():
+            if not isinstance(wsocks, list):
+                continue
+            drivers = self.outputs.drivers.get(name, ())
+            indices = self.outputs.unames_indices.get(name, {})
+            if not drivers or not indices:
+                continue
+            
+            if len(drivers) == 1:
+                table = {key[0]: index for key, index in indices.items()}
+            else:
+                table = indices
+            yield _1_ + f"_OUT_{name.upper()} = MappingProxyType({table})"
+            
+    # ----------------------------------------------------------------------------------------------------
+    # Bulk constructor: several nodes from columns of arguments
+    #
+    # @classmethod
+    # def Many(cls, value0=None, value1=None, operation='ADD', label=None, node_color=None, nodes_count=None):
+    #     return cls.bulk_nodes(nodes_count, 'ShaderNodeMath', 'Math',
+    #         params  = [('operation', operation, _OPERATION_1, 'ADD')],
+    #         sockets = [('value0', value0), ('value1', value1)],
+    #         label=label, node_color=node_color)
+    #
+    # Node.bulk_nodes creates the nodes and does the shared work once (see package_init_source).
+    # The multi input sockets are given as (index, values): the values are the same for all the nodes.
+    # The nodes are created without calling __init__: requires the class sockets tables.
+    
+    def gen_bulk_constructor(self, enum_constants=None):
+        
+        headers = []
+        for arg in self.get_node_arguments():
+            if arg.sheader == "":
+                continue
+            headers.append(f"{arg.name}=()" if arg.is_multi else arg.sheader)
+        headers.extend(["label=None", "node_color=None", "nodes_count=None"])
+        
+        params = []
+        for name, param in self.parameters.items():
+            if param.is_enum and enum_constants is not None:
+                values = enum_constants.names(param.name, param.values)[0]
+            elif param.is_enum:
+                values = param.values
+            else:
+                values = None
+            params.append(f"('{param.name}', {name}, {values}, {param.default!r})")
+            
+        sockets = []
+        for uname, wsocks in self.inputs.unames.items():
+            if not isinstance(wsocks, list) and wsocks.is_multi_input:
+                sockets.append(f"({wsocks.index}, {uname})")
+            else:
+                sockets.append(f"('{uname}', {uname})")
+        
+        yield _1_ + "@classmethod"
+        yield _1_ + f"def Many(cls, {', '.join(headers)}):"
+        yield _2_ + '"""Create several nodes from columns of arguments (see Node.bulk_nodes)"""'
+        yield _2_ + f"return cls.bulk_nodes(nodes_count, '{self.bl_idname}', '{self.blender_name}',"
+        yield _2_ + f"    params  = [{', '.join(params)}],"
+        yield _2_ + f"    sockets = [{', '.join(sockets)}],"
+        yield _2_ + "    label=label, node_color=node_color)\n"
+            
+    # ----------------------------------------------------------------------------------------------------
+    # Tables as instance attributes set in __init__
+    
+    def gen_init_sockets_tables(self):
+        
+        yield _2_ + "# Input and output sockets names (for use in __getattr__ and __setattr__)\n"
+        
+        yield _2_ + "self.insockets = {"
+        for uname, wsocks in self.inputs.unames.items():
+            if isinstance(wsocks, list):
+                yield f"'{uname}' : {self.inputs.shared_indices(uname)}, "
+            else:
+                yield f"'{uname}' : {wsocks.index}, "
+        yield "}"
+        
+        
+        yield _2_ + "self.outsockets = {"
+        for uname, wsocks in self.outputs.unames.items():
+            if isinstance(wsocks, list):
+                yield f"'{uname}' : {self.outputs.shared_indices(uname)}, "
+            else:
+                yield f"'{uname}' : {wsocks.index}, "
+        yield "}\n"
+        
+        # ----- Output sockets class
+        
+        out_classes = OUTPUT_SOCKETS_CLASS.get(self.bl_idname, None)
+        if out_classes is not None:
+            yield _2_ + "# Force class of output sockets\n"
+            yield _2_ + f"self.outsockets_classes = {out_classes}\n"
+
+    # ====================================================================================================
+    # Node class comment
+    
+    def gen_class_comment(self, cl_gen=None):
+        
+        yield _1_ + '"""' + f"Node *{self.blender_name}*\n"
+        yield _1_ + f".. _{self.node_name}:\n"
+        
+        # ---- Classes calling this node
+        
+        if cl_gen is not None:
+            node_ref = cl_gen.get(self.bl_idname)
+            if node_ref is None:
+                pass
+                #print(f"CAUTION: node {self.bl_idname} not implemented in class generators")
+                
+            else:
+                yield _1_ + "Node implementation:"
+                for class_name, gs in node_ref.items():
+                    if class_name == 'functions':
+                        yield _2_ + 'global functions:'
                     else:
                         yield _2_ + f"{class_name}:"
                         
@@ -2008,7 +2766,7 @@ class WNode:
         for uname, wsock in self.inputs.unames.items():
             
             if isinstance(wsock, list):
-                sval = f"``{self.driving_param}`` dependant"
+                sval = self.dependant_str(self.inputs.drivers[uname], "``{}``")
             elif wsock.is_multi_input:
                 sval = f"<m> {wsock.class_name}"
             else:
@@ -2038,7 +2796,7 @@ class WNode:
             for uname, wsock in self.outputs.unames.items():
                 
                 if isinstance(wsock, list):
-                    sval = f"``{self.driving_param}`` dependant"
+                    sval = self.dependant_str(self.outputs.drivers[uname], "``{}``")
                 else:
                     sval = wsock.class_name
                         
@@ -2049,14 +2807,82 @@ class WNode:
             
             yield _0_ + _1_ + "Shared sockets:"
                                      
-            yield _2_ + f"- Driving parameter : ``{self.driving_param}`` in {self.parameters[self.driving_param].values}"
+            yield _2_ + f"- {self.driving_params_str('``{}``')}"
             yield _2_ + f"- Input sockets  : {list(self.inputs.shared_sockets.keys())}"
             yield _2_ + f"- Output sockets : {list(self.outputs.shared_sockets.keys())}"
             
         yield _0_ + _1_ + f".. blid:: {self.bl_idname}"
                 
         yield _0_ + _1_ + '"""' + "\n"
+        
+    # ====================================================================================================
+    # Generate the node class
+    
+    # class_sockets  : socket tables are emitted as class constants rather than set in __init__
+    # enum_constants : EnumConstants declaring the enum values at module level
+    #                  (the values are written in the check_enum_value call if None)
+    # doc_store      : lean generation, the class comment is written in the doc store (see code_gen.DocStore)
+    
+    def gen_node_class(self, wrap_parameters=True, cl_gen=None, class_sockets=True, enum_constants=None, doc_store=None, indexed_outputs=True, skip_defaults=True, batch_links=True, bulk=True):
+        
+        args = self.get_node_arguments()
+        
+        # ---------------------------------------------------------------------------
+        # Class header
+        #
+        # class NodeMath(Node):
+        
+        yield _0_ + f"class {self.node_name}(Node):\n"
+    
+        # ---------------------------------------------------------------------------
+        # Class comment
+        
+        if doc_store is None:
+            yield from self.gen_class_comment(cl_gen)
+        else:
+            doc_store.add(f"nodes.{self.node_name}", "".join(self.gen_class_comment(cl_gen)).strip()[3:-3])
+            yield _1_ + '"""' + f"Node *{self.blender_name}* (see docstore.help)" + '"""' + "\n"
+        
+        # ---------------------------------------------------------------------------
+        # Input and output socket unique names towards indices
+        # Node insockets and outsockets provide the index (or list of indices) for each socket uname
+        # - outsockets is used by getattr to get the output sockets by their name
+        # - insockets is used by setattr to plug in input sockets
+        #
+        # The tables don't change: they are class constants read by the Node base class
+        
+        if class_sockets:
+            yield _1_ + "# Input and output sockets names (for use in __getattr__ and __setattr__)"
+            yield _1_ + f"insockets  = MappingProxyType({self.sockets_table(self.inputs)})"
+            yield _1_ + f"outsockets = MappingProxyType({self.sockets_table(self.outputs)})\n"
             
+            out_classes = OUTPUT_SOCKETS_CLASS.get(self.bl_idname, None)
+            if out_classes is not None:
+                yield _1_ + "# Force class of output sockets"
+                yield _1_ + f"outsockets_classes = MappingProxyType({out_classes})\n"
+                
+        # ---------------------------------------------------------------------------
+        # Parameters values of a fresh node
+        # __init__ writes only the parameters with a different value
+        
+        if skip_defaults and self.parameters:
+            defaults = {param.name: param.default for param in self.parameters.values()}
+            yield _1_ + "# Parameters values of a fresh node: __init__ only writes the other values"
+            yield _1_ + f"parameters_defaults = MappingProxyType({defaults})\n"
+            
+        # ---------------------------------------------------------------------------
+        # Indices of the shared output sockets from the driving parameters values
+        
+        if indexed_outputs:
+            if len(self.outputs):
+                yield _1_ + "# Class of the output sockets per index"
+                yield _1_ + f"_OUT_CLASSES = {tuple(wsock.class_name for wsock in self.outputs)}\n"
+                
+            tables = list(self.gen_output_indices_tables())
+            if tables:
+                yield _1_ + "# Output sockets indices from the values of the driving parameters"
+                yield from tables
+                yield "\n"
             
     
         # ---------------------------------------------------------------------------
@@ -2075,7 +2901,7 @@ class WNode:
         #
         # super().__init__(bl_idname, name, label)
         
-        yield _2_ + f"super().__init__('{self.bl_idname}', node_name='{self.bnode.name}', label=label, node_color=node_color)\n"
+        yield _2_ + f"super().__init__('{self.bl_idname}', node_name='{self.blender_name}', label=label, node_color=node_color)\n"
 
         # ---------------------------------------------------------------------------
         # Parameters
@@ -2089,13 +2915,15 @@ class WNode:
                     yield _2_ + "# Node parameters to configure the sockets enablement\n"
                 else:
                     yield _2_ + "# Node parameters\n"
+                if skip_defaults:
+                    yield _2_ + "defaults = self.parameters_defaults"
                 yield_comment = False
                 
             # self.param = arg
             
             # OLD: call value_data_type for data_type attribute
             if False:
-                if self.has_shared_sockets and param.name == self.driving_param:
+                if self.has_shared_sockets and param.name in self.driving_params:
                     
                     socket_name = None
                     for uname, wsocks in self.inputs.unames.items():
@@ -2112,10 +2940,18 @@ class WNode:
                     
             # NEW: call check_enum_value for all enum values
             else:
-                if param.is_enum:
-                    yield _2_ + f"self.bnode.{param.name:15s} = self.check_enum_value({name}, '{param.name}', {param.values}, '{param.default}')"
+                if skip_defaults:
+                    sif = f"if {name:15s} != defaults['{param.name}']: "
                 else:
-                    yield _2_ + f"self.bnode.{param.name:15s} = {name}"
+                    sif = ""
+                    
+                if param.is_enum and enum_constants is not None:
+                    values, valid = enum_constants.names(param.name, param.values)
+                    yield _2_ + sif + f"self.bnode.{param.name:15s} = {name} if isinstance({name}, str) and {name} in {valid} else self.check_enum_value({name}, '{param.name}', {values}, '{param.default}')"
+                elif param.is_enum:
+                    yield _2_ + sif + f"self.bnode.{param.name:15s} = self.check_enum_value({name}, '{param.name}', {param.values}, '{param.default}')"
+                else:
+                    yield _2_ + sif + f"self.bnode.{param.name:15s} = {name}"
                 
                 
         
@@ -2123,45 +2959,31 @@ class WNode:
             yield "\n"
             
         # ---------------------------------------------------------------------------
-        # Input and output socket unique names towards indices
-        # Node insockets and outsockets provide the index (or list of indices) for each socket uname
-        # - outsockets is used by getattr to get the output sockets by their name
-        # - insockets is used by setattr to plug in input sockets
-        #self.insockets  = {}
-        #self.outsockets = {}
-        
-        yield _2_ + "# Input and output sockets names (for use in __getattr__ and __setattr__)\n"
-        
-        yield _2_ + "self.insockets = {"
-        for uname, wsocks in self.inputs.unames.items():
-            if isinstance(wsocks, list):
-                yield f"'{uname}' : {[ws.index for ws in wsocks]}, "
-            else:
-                yield f"'{uname}' : {wsocks.index}, "
-        yield "}"
-        
-        
-        yield _2_ + "self.outsockets = {"
-        for uname, wsocks in self.outputs.unames.items():
-            if isinstance(wsocks, list):
-                yield f"'{uname}' : {[ws.index for ws in wsocks]}, "
-            else:
-                yield f"'{uname}' : {wsocks.index}, "
-        yield "}\n"
-        
-        # ---------------------------------------------------------------------------
-        # Output sockets class
+        # Sockets tables set in __init__ (previous generation, see class_sockets)
         
-        out_classes = OUTPUT_SOCKETS_CLASS.get(self.bnode.bl_idname, None)
-        if out_classes is not None:
-            yield _2_ + "# Force class of output sockets\n"
-            yield _2_ + f"self.outsockets_classes = {out_classes}\n"
+        if not class_sockets:
+            yield from self.gen_init_sockets_tables()
 
         # ---------------------------------------------------------------------------
         # Now that the insockets are declared, we can set the input sockets
         
+        # Batched: the sockets are given in one call to plug_sockets
+        #   (uname, value) or (index, values) for multi input sockets
+        #   plug_sockets queues the links on the tree which creates them when it exits
+        
+        if batch_links and self.inputs.unames:
+            plugs = []
+            for uname, wsocks in self.inputs.unames.items():
+                if not isinstance(wsocks, list) and wsocks.is_multi_input:
+                    plugs.append(f"({wsocks.index}, {uname})")
+                else:
+                    plugs.append(f"('{uname}', {uname})")
+                    
+            yield _2_ + "# Input sockets plugging, the links are created when the tree exits\n"
+            yield _2_ + f"self.plug_sockets([{', '.join(plugs)}])\n"
+        
         yield_comment = True
-        for uname, wsocks in self.inputs.unames.items():
+        for uname, wsocks in ({} if batch_links else self.inputs.unames).items():
             if yield_comment:
                 yield _2_ + "# Input sockets plugging\n"
                 yield_comment = False
@@ -2177,6 +2999,12 @@ class WNode:
         if not yield_comment:
             yield "\n"
     
+        # ---------------------------------------------------------------------------
+        # Bulk constructor
+        
+        if bulk and class_sockets:
+            yield from self.gen_bulk_constructor(enum_constants)
+    
         # ---------------------------------------------------------------------------
         # Wrap the parameters
         
@@ -2193,10 +3021,13 @@ class WNode:
         # ---------------------------------------------------------------------------
         # Output sockets
         
-        for name, wsock in self.outputs.unames.items():
-            yield _1_ + "@property"
-            yield _1_ + f"def {name}(self):"
-            yield _2_ + f"return self.get_output_socket('{name}')\n"
+        if indexed_outputs:
+            yield from self.gen_output_properties()
+        else:
+            for name, wsock in self.outputs.unames.items():
+                yield _1_ + "@property"
+                yield _1_ + f"def {name}(self):"
+                yield _2_ + f"return self.get_output_socket('{name}')\n"
             
         # ---------------------------------------------------------------------------
         # Input sockets
@@ -2213,6 +3044,151 @@ class WNode:
             yield _2_ + f"self.set_input_socket('{name}', value)\n"
 
         
+# ====================================================================================================
+# The tree used to create the nodes
+#
+# Created if it doesn't exist (blender --background --factory-startup for instance)
+
+def geometry_nodes_tree():
+    tree = bpy.data.node_groups.get("Geometry Nodes")
+    if tree is None:
+        tree = bpy.data.node_groups.new("Geometry Nodes", 'GeometryNodeTree')
+    return tree
+
+# ====================================================================================================
+# Enum values declared as module constants in the generated nodes module
+#
+# A constant is shared by the parameters having the same name and values:
+#
+# _DATA_TYPE     = ('FLOAT', 'INT', ...)    : passed to check_enum_value for the error message
+# _DATA_TYPE_SET = frozenset(_DATA_TYPE)    : fast validation
+#
+# The valid values are assigned without calling check_enum_value
+
+class EnumConstants(dict):
+    
+    def __init__(self, wnodes=None):
+        super().__init__()
+        self.counts = {}
+        if wnodes is not None:
+            for wnode in wnodes.values():
+                for param in wnode.parameters.values():
+                    if param.is_enum:
+                        self.names(param.name, param.values)
+                        
+    # ----- Constant names for the values of a parameter
+        
+    def names(self, param_name, values):
+        key = (param_name, tuple(values))
+        name = self.get(key)
+        if name is None:
+            base = "_" + param_name.upper()
+            count = self.counts.get(base, 0)
+            self.counts[base] = count + 1
+            name = base if count == 0 else f"{base}_{count}"
+            self[key] = name
+        return name, name + "_SET"
+    
+    # ----- Constants used by a list of nodes
+    
+    def used(self, wnodes):
+        names = []
+        for wnode in wnodes:
+            for param in wnode.parameters.values():
+                if param.is_enum:
+                    for name in self.names(param.name, param.values):
+                        if name not in names:
+                            names.append(name)
+        return names
+    
+    # ----- Module source code
+    
+    def source(self):
+        s = f"# {'-'*100}\n# Enum parameters values\n\n"
+        for (_, values), name in self.items():
+            s += f"{name} = {values}\n"
+            s += f"{name}_SET = frozenset({name})\n"
+        return s + "\n"
+
+# ====================================================================================================
+# Introspection trace
+#
+# When TRACE is set, the introspection records per node type:
+# - create     : time to create the Blender node
+# - probe      : time to read the parameters
+# - sweeps     : number of parameters combinations applied to explore the enabled sockets
+# - sweep_time : time of the exploration
+# - sockets    : number of input and output sockets
+# plus the types which failed to be created with the error message.
+#
+# Use: create_geonodes(fpath, version, trace=fpath + "trace.json")
+
+TRACE = None
+
+class IntrospectionTrace:
+    
+    def __init__(self):
+        self.nodes    = {}
+        self.failures = {}
+        self.cached   = []
+        
+    def record(self, bl_idname):
+        rec = self.nodes.get(bl_idname)
+        if rec is None:
+            rec = {'create': 0., 'probe': 0., 'sweeps': 0, 'sweep_time': 0., 'sockets': 0}
+            self.nodes[bl_idname] = rec
+        return rec
+    
+    def created(self, bl_idname, duration):
+        self.record(bl_idname)['create'] = duration
+        
+    def failed(self, bl_idname, exception):
+        self.failures[bl_idname] = f"{type(exception).__name__}: {exception}"
+        
+    def explored(self, wnode, probe, sweeps, sweep_time):
+        rec = self.record(wnode.bl_idname)
+        rec['probe']      = probe
+        rec['sweeps']     = sweeps
+        rec['sweep_time'] = sweep_time
+        rec['sockets']    = len(wnode.inputs) + len(wnode.outputs)
+        
+    def reused(self, wnode):
+        self.cached.append(wnode.bl_idname)
+        self.record(wnode.bl_idname)['sockets'] = len(wnode.inputs) + len(wnode.outputs)
+        
+    @staticmethod
+    def total(rec):
+        return rec['create'] + rec['probe'] + rec['sweep_time']
+        
+    # ----------------------------------------------------------------------------------------------------
+    # Json trace
+    
+    def write(self, fname):
+        trace = {
+            'blender_version' : bpy.app.version_string,
+            'nodes'           : self.nodes,
+            'cached'          : self.cached,
+            'failures'        : self.failures,
+            }
+        with open(fname, 'w') as f:
+            json.dump(trace, f, indent=1)
+            
+    # ----------------------------------------------------------------------------------------------------
+    # Slowest nodes
+    
+    def print_report(self, top=20):
+        
+        nodes = sorted(self.nodes.items(), key=lambda item: self.total(item[1]), reverse=True)
+        total = sum([self.total(rec) for rec in self.nodes.values()])
+        
+        print()
+        print(f"Introspection: {len(self.nodes)} nodes in {total:.2f} s, {len(self.cached)} reused from cache, {len(self.failures)} types not created")
+        print()
+        print(f"{'node':40s} {'create':>8s} {'probe':>8s} {'sweeps':>7s} {'sweep':>8s} {'sockets':>8s} {'total':>8s}")
+        for bl_idname, rec in nodes[:top]:
+            print(f"{bl_idname:40s} {rec['create']*1000:5.1f} ms {rec['probe']*1000:5.1f} ms {rec['sweeps']:7d} {rec['sweep_time']*1000:5.1f} ms {rec['sockets']:8d} {self.total(rec)*1000:5.1f} ms")
+        print()
+
 # ====================================================================================================
 # Create a tree with all the possible nodes
 
@@ -2222,21 +3198,144 @@ class BNodes(dict):
         print("Collecting the available geometry nodes...")        
         super().__init__()
 
-        btree_nodes = bpy.data.node_groups["Geometry Nodes"].nodes
+        btree_nodes = geometry_nodes_tree().nodes
         btree_nodes.clear()
 
+        for tp in BNodes.node_types():
+            bnode = BNodes.new_node(btree_nodes, tp)
+            if bnode is not None:
+                self[tp] = bnode
+                
+    # ----------------------------------------------------------------------------------------------------
+    # Create a node of the given type
+    #
+    # Returns None if the node type can't be created in the tree.
+    # The failures and the creation times are recorded when tracing
+    
+    @staticmethod
+    def new_node(btree_nodes, tp):
+        t0 = time.perf_counter()
+        try:
+            bnode = btree_nodes.new(tp)
+        except Exception as e:
+            if TRACE is not None:
+                TRACE.failed(tp, e)
+            return None
+        
+        if TRACE is not None:
+            TRACE.created(tp, time.perf_counter() - t0)
+        return bnode
+            
+    # ----------------------------------------------------------------------------------------------------
+    # The candidate types
+    #
+    # Only the node classes are candidates: the other types (Object, Mesh...) are not
+    # passed to nodes.new() and don't appear as failures in the trace
+    
+    @staticmethod
+    def node_types():
         for tp in dir(bpy.types):
+            if tp in DEPRECATED or tp in NODE_BASES or tp.find('Legacy') >= 0:
+                continue
+            cls = getattr(bpy.types, tp)
+            if isinstance(cls, type) and issubclass(cls, bpy.types.Node):
+                yield tp
+                
+    # ----------------------------------------------------------------------------------------------------
+    # Streaming mode
+    #
+    # Rather than keeping all the nodes in the tree, the nodes are created one at a time
+    # and removed from the tree when the caller asks for the next one.
+    # The caller must not keep a reference to the yielded node (see WNode.detach)
+    
+    @staticmethod
+    def stream(node_types=None):
+        print("Streaming the available geometry nodes...")        
+
+        btree_nodes = geometry_nodes_tree().nodes
+        btree_nodes.clear()
+        
+        for tp in BNodes.node_types() if node_types is None else node_types:
+            bnode = BNodes.new_node(btree_nodes, tp)
+            if bnode is None:
+                continue
+            
+            yield bnode
+            
+            btree_nodes.remove(bnode)
+            
+# ----------------------------------------------------------------------------------------------------
+# Node signature
+#
+# A cheap hash of what the introspection depends on: sockets names and types, parameters names
+# and enum items, plus the generator settings for the node.
+# The signature is computed without changing the node parameters.
+
+def node_signature(bnode):
+    
+    params = []
+    for name in dir(bnode):
+        if name in WNode.STD_ATTRS and name != 'type':
+            continue
+        prop = bnode.bl_rna.properties.get(name)
+        if prop is not None and prop.type == 'ENUM':
+            params.append((name, [item.identifier for item in prop.enum_items]))
+        else:
+            params.append((name, None))
+            
+    sig = (
+        bnode.bl_idname,
+        bnode.name,
+        [(bsocket.name, bsocket.bl_idname, bsocket.is_multi_input) for bsocket in bnode.inputs],
+        [(bsocket.name, bsocket.bl_idname) for bsocket in bnode.outputs],
+        params,
+        OUTPUT_SOCKETS_CLASS.get(bnode.bl_idname),
+        INPUT_SOCKETS_ORDER.get(bnode.bl_idname),
+        )
+    
+    return hashlib.sha1(repr(sig).encode()).hexdigest()
+    
+# ----------------------------------------------------------------------------------------------------
+# Create the node wrappers
+#
+# In streaming mode, the wrappers are detached from the Blender nodes which are
+# removed from the tree once introspected.
+#
+# cache is the file name of a previous catalog: the nodes with an unchanged signature
+# are loaded from the catalog rather than explored again.
+
+def collect_wnodes(stream=False, cache=None, trace=None):
+    
+    global TRACE
+    
+    cached = cached_nodes(cache)
+    reused = 0
+    
+    TRACE = trace
+    try:
+        bnodes = BNodes.stream() if stream else BNodes().values()
+        for bnode in bnodes:
+            
+            signature = node_signature(bnode)
             
-            if tp in DEPRECATED:
+            data = cached.get(bnode.bl_idname)
+            if data is not None and data['signature'] == signature:
+                wnode = WNode.FromDict(data)
+                if trace is not None:
+                    trace.reused(wnode)
+                reused += 1
                 continue
             
-            if tp.find('Legacy') < 0:
-                try:
-                    bnode = btree_nodes.new(tp)
-                except:
-                    continue
-                self[tp] = bnode
+            wnode = WNode(bnode, signature=signature)
+            if stream:
+                wnode.detach()
+    finally:
+        TRACE = None
+            
+    if cache is not None:
+        print(f"Nodes reused from cache: {reused}, explored: {len(WNode.WNODES) - reused}")
             
+    return WNode.WNODES
                 
 
 # ====================================================================================================
@@ -2285,16 +3384,23 @@ def create_data_sockets(fpath):
 
 # ----------------------------------------------------------------------------------------------------
 # Create all the nodes
+#
+# The node classes are split in one module per Blender add menu and imported on demand:
+#
+# - nodes/enums.py       : enum values constants (see EnumConstants)
+# - nodes/menu_xxx.py    : the node classes of the menu xxx
+# - nodes/nodes.py       : facade module: nodes.Math imports menu_utilities on first access
+#                          plus the registry to create the nodes from their bl_idname
+# - nodes/__init__.py    : gives also access to the node classes on demand
 
-def create_nodes(fpath, BNODES):
+EXCLUDED_NODES = ['NodeReroute', 'NodeGroupInput', 'NodeGroupOutput', 'NodeFrame']
+
+def generated_header(version_string, comment=None):
     
-    fname = fpath + "nodes/nodes.py"
+    QUOTES = '"""'
+    scomment = "" if comment is None else f"\n{comment}\n"
     
-    with open(fname, 'w') as f:
-        
-        QUOTES = '"""'
-        
-        f.write(f"""#!/usr/bin/env python3
+    return f"""#!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
 {QUOTES}
@@ -2302,51 +3408,585 @@ Created on {date.today()}
 
 @author: Generated from generator module
 
-Blender version: {bpy.app.version_string}
-{QUOTES}
+Blender version: {version_string}
+{scomment}{QUOTES}
 
-from geonodes.core.node import Node
+"""
 
-""")
+# ----------------------------------------------------------------------------------------------------
+# Module of a node, from its menu in code_gen or in NODES_MENU
 
-        creation = []
-        for bnode in BNODES.values():
-            
-            # ----------------------------------------------------------------------------------------------------
-            # Load the node
+def node_module(wnode):
+    
+    for menu, nodes in code_gen.NODE_MENUS.items():
+        if wnode.bl_idname in nodes:
+            return "menu_" + menu.lower().replace(' ', '_')
+        
+    ref = NODES_MENU.get(wnode.blender_ref_name)
+    if ref is not None:
+        return "menu_" + ref[0]
+    
+    return "menu_other"
+
+def create_nodes(fpath, wnodes, version_string, doc_store=None):
+    
+    folder = fpath + "nodes/"
+    
+    # ----- Nodes per module
+    
+    modules = {}
+    for wn in wnodes.values():
+        if wn.bl_idname in EXCLUDED_NODES:
+            continue
+        
+        module = node_module(wn)
+        if module in modules:
+            modules[module].append(wn)
+        else:
+            modules[module] = [wn]
+    
+    # ----- Enum constants
+    
+    enum_constants = EnumConstants(wnodes)
+    
+    with open(folder + "enums.py", 'w') as f:
+        f.write(generated_header(version_string, "Enum values of the nodes parameters"))
+        f.write(enum_constants.source())
+        
+    # ----- One module per menu
+    
+    for module, wns in modules.items():
+        with open(f"{folder}{module}.py", 'w') as f:
             
-            wn = WNode.WNODES[bnode.bl_idname]
+            f.write(generated_header(version_string, f"Nodes of menu {module[5:]}"))
+            f.write("from types import MappingProxyType\n\n")
+            f.write("from geonodes.core.node import Node\n")
             
-            # ----- Some exclusion
+            constants = enum_constants.used(wns)
+            if constants:
+                f.write(f"from geonodes.nodes.enums import {', '.join(constants)}\n")
+            f.write("\n")
             
-            if wn.bl_idname in ['NodeReroute', 'NodeGroupInput', 'NodeGroupOutput', 'NodeFrame']:
+            for wn in wns:
+                f.write(f"\n# {'-'*100}\n")
+                f.write(f"# Node {wn.node_name} for {wn.bl_idname}\n")
+                
+                for line in wn.gen_node_class(cl_gen=code_gen.ALL, enum_constants=enum_constants, doc_store=doc_store):
+                    f.write(line)
+                    
+    # ----- Facade and registry
+    
+    with open(folder + "nodes.py", 'w') as f:
+        f.write(generated_header(version_string, "Node classes are loaded from their menu module on first access"))
+        f.write(node_registry_source(modules))
+        
+    # ----- Package init
+    
+    with open(folder + "__init__.py", 'w') as f:
+        f.write(generated_header(version_string, "geonodes.nodes package\nNode classes are loaded from their menu module on first access"))
+        f.write(package_init_source(modules))
+        
+    import_time_report(folder, modules)
+        
+# ----------------------------------------------------------------------------------------------------
+# Source code of the nodes facade and of the registry of the node classes per bl_idname
+#
+# - NODE_NAMES            : bl_idname -> class name
+# - NODE_MODULES          : class name -> module name
+# - NODE_CLASSES          : bl_idname -> node class, filled on demand
+# - create_node           : create a node from its bl_idname
+# - create_nodes_many     : create a batch of nodes from (bl_idname, kwargs) specs,
+#                           the classes are resolved before any node is created
+
+def node_registry_source(modules):
+    
+    O = "{"
+    C = "}"
+    
+    names   = []
+    modules_ = []
+    for module, wns in modules.items():
+        for wn in wns:
+            names.append(f"'{wn.bl_idname}': '{wn.node_name}'")
+            modules_.append(f"'{wn.node_name}': '{module}'")
+    
+    snames   = ",\n    ".join(names)
+    smodules = ",\n    ".join(modules_)
+    
+    return f"""import importlib
+
+# {'-'*80}
+# Node class names by bl_idname
+
+NODE_NAMES = {O}
+    {snames},
+    {C}
+
+# {'-'*80}
+# Module of the node classes
+
+NODE_MODULES = {O}
+    {smodules},
+    {C}
+
+# {'-'*80}
+# Load a node class from its module
+# The class is then a global of this module: __getattr__ is not called anymore
+
+def node_class(name):
+    module = importlib.import_module(f"geonodes.nodes.{O}NODE_MODULES[name]{C}")
+    cls = getattr(module, name)
+    globals()[name] = cls
+    return cls
+
+def __getattr__(name):
+    if name in NODE_MODULES:
+        return node_class(name)
+    raise AttributeError(f"module '{O}__name__{C}' has no attribute '{O}name{C}'")
+
+# {'-'*80}
+# Node classes by bl_idname, loaded on demand
+
+class NodeClasses(dict):
+    def __missing__(self, bl_idname):
+        cls = node_class(NODE_NAMES[bl_idname])
+        self[bl_idname] = cls
+        return cls
+
+NODE_CLASSES = NodeClasses()
+
+# {'-'*80}
+# Create node from its bl_idname
+
+def create_node(bl_idname, *args, **kwargs):
+    return NODE_CLASSES[bl_idname](*args, **kwargs)
+
+# {'-'*80}
+# Create nodes from a list of (bl_idname, kwargs)
+# Raises KeyError before creating any node if a bl_idname is unknown
+
+def create_nodes_many(specs):
+    specs = list(specs)
+    classes = {O}bl_idname: NODE_CLASSES[bl_idname] for bl_idname in {O}bl_idname for bl_idname, _ in specs{C}{C}
+    return [classes[bl_idname](**kwargs) for bl_idname, kwargs in specs]
+
+""" + PURE_NODES_SOURCE
+
+# ----------------------------------------------------------------------------------------------------
+# Source code of the hash-consing of the pure nodes, part of the nodes facade
+#
+# The generated methods create the pure nodes (see code_gen.PURE_NODES) with pure_node:
+# a node created with the same parameters and the same plugged sockets in the current tree
+# is returned rather than a duplicated one.
+# The current tree is read in Tree.TREE: no sharing without current tree.
+
+PURE_NODES_SOURCE = """# --------------------------------------------------------------------------------
+# Pure nodes shared in the current tree
+#
+# The key is made of the class, the literal values and the Blender sockets plugged.
+# The other values are keyed by identity, the arguments are kept with the node.
+# The shared node is handed to all the callers: it must not be modified after its creation
+# (parameters or input sockets), the modification would change the result of every caller.
+# The sockets are read when the node is created (see plug_sockets): the links queued for the
+# node don't change after.
+# SHARE_PURE_NODES = False creates a new node at each call.
+
+SHARE_PURE_NODES = True
+
+MEMO = {'Tree': None, 'tree': None, 'nodes': {}}
+
+LITERALS = (int, float, bool, str, type(None))
+
+def memo_key(value):
+    if type(value) in LITERALS:
+        return (type(value).__name__, value)
+    if type(value) in (list, tuple):
+        return (type(value).__name__,) + tuple(memo_key(v) for v in value)
+    bsocket = getattr(value, 'bsocket', None)
+    if bsocket is not None:
+        return ('bsocket', bsocket.as_pointer())
+    return ('id', id(value))
+
+def current_tree():
+    if MEMO.get('Tree') is None:
+        from geonodes.core.tree import Tree
+        MEMO['Tree'] = Tree
+    return getattr(MEMO['Tree'], 'TREE', None)
+
+def pure_node(cls, **kwargs):
+
+    if not SHARE_PURE_NODES:
+        return cls(**kwargs)
+
+    tree = current_tree()
+    if tree is None:
+        return cls(**kwargs)
+
+    if MEMO['tree'] is not tree:
+        MEMO['tree']  = tree
+        MEMO['nodes'] = {}
+
+    key = (cls,) + tuple((name, memo_key(value)) for name, value in kwargs.items())
+
+    entry = MEMO['nodes'].get(key)
+    if entry is None:
+        entry = (cls(**kwargs), kwargs)
+        MEMO['nodes'][key] = entry
+
+    return entry[0]
+
+"""
+
+# ----------------------------------------------------------------------------------------------------
+# Source code of the nodes package init
+#
+# The node classes are read through the facade module
+
+def package_init_source(modules):
+    
+    smenus = ", ".join([f"'{module}'" for module in modules])
+    
+    return f"""import importlib
+
+from geonodes.core.node import Node
+from geonodes.core.tree import Tree
+
+# Methods used by the generated classes, for a Node base class which doesn't provide them
+# - output_socket : the output sockets properties give the socket index: the Blender socket is
+#                   read by index and wrapped in the geonodes class of the socket (_OUT_CLASSES).
+#                   The socket is resolved by its name if the class is not found in geonodes
+# - plug_sockets  : the links from the output sockets are not created by the constructor: the
+#                   Blender sockets are read when plug_sockets is called and the link is queued
+#                   (see PENDING_LINKS). The queued links are created in one pass by
+#                   Tree.flush_links when the tree exits.
+#                   The other values (literals, vectors...) and the sockets outside a tree are plugged
+#                   immediately. Writing an input socket drops the link queued on it.
+#                   Call tree.flush_links() to read the links before the end of the tree.
+
+OUTPUT_CLASSES = {{}}
+
+def output_class(class_name):
+    cls = OUTPUT_CLASSES.get(class_name)
+    if cls is None and class_name not in OUTPUT_CLASSES:
+        import geonodes
+        cls = OUTPUT_CLASSES[class_name] = getattr(geonodes, class_name, None)
+    return cls
+
+if not hasattr(Node, 'output_socket'):
+    def output_socket(self, index, name):
+        cls = output_class(self._OUT_CLASSES[index])
+        if cls is None:
+            return self.get_output_socket(name)
+        return cls(self.bnode.outputs[index])
+    Node.output_socket = output_socket
+    
+# {'-'*80}
+# Links queued by plug_sockets
+#
+# PENDING_LINKS : input socket pointer -> (Blender tree, list of output Blender sockets, input Blender socket)
+#                 a multi input socket has one link per output socket, in the plugging order
+# PENDING_FROM  : output socket pointer -> number of queued links from the socket
+
+PENDING_LINKS = {{}}
+PENDING_FROM  = {{}}
+
+def output_bsocket(value):
+    bsocket = getattr(value, 'bsocket', None)
+    if bsocket is None or not getattr(bsocket, 'is_output', False):
+        return None
+    return bsocket
+
+def input_bsockets(node, name):
+    index = node.insockets[name]
+    if isinstance(index, list):
+        return [node.bnode.inputs[i] for i in index]
+    return [node.bnode.inputs[index]]
+
+def drop_links(to_bsocket):
+    entry = PENDING_LINKS.pop(to_bsocket.as_pointer(), None)
+    if entry is not None:
+        for from_bsocket in entry[1]:
+            key = from_bsocket.as_pointer()
+            PENDING_FROM[key] -= 1
+            if not PENDING_FROM[key]:
+                del PENDING_FROM[key]
+    return entry
+
+def queue_link(btree, from_bsocket, to_bsocket, append=False):
+    key = to_bsocket.as_pointer()
+    if not append:
+        drop_links(to_bsocket)
+    entry = PENDING_LINKS.get(key)
+    if entry is None:
+        entry = PENDING_LINKS[key] = (btree, [], to_bsocket)
+    entry[1].append(from_bsocket)
+    key = from_bsocket.as_pointer()
+    PENDING_FROM[key] = PENDING_FROM.get(key, 0) + 1
+
+def create_links(entry):
+    btree, from_bsockets, to_bsocket = entry
+    for from_bsocket in from_bsockets:
+        btree.links.new(from_bsocket, to_bsocket)
+
+def flush_input(to_bsocket):
+    entry = drop_links(to_bsocket)
+    if entry is not None:
+        create_links(entry)
+
+def clear_links():
+    PENDING_LINKS.clear()
+    PENDING_FROM.clear()
+
+def flush_links(self=None):
+    entries = list(PENDING_LINKS.values())
+    clear_links()
+    for entry in entries:
+        create_links(entry)
+
+# Linked or with a queued link, for an input or an output socket
+
+def is_linked(bsocket):
+    if bsocket.is_linked:
+        return True
+    return bsocket.as_pointer() in (PENDING_FROM if bsocket.is_output else PENDING_LINKS)
+
+if not hasattr(Node, 'plug_sockets'):
+    def plug_sockets(self, sockets):
+        tree = getattr(Tree, 'TREE', None)
+        for name, value in sockets:
+            if value is None:
                 continue
+                
+            # Multi input socket: (index, values)
+            if isinstance(name, int):
+                to_bsocket    = self.bnode.inputs[name]
+                from_bsockets = [output_bsocket(v) for v in value]
+                if tree is None or None in from_bsockets:
+                    flush_input(to_bsocket)
+                    self.plug(name, *value)
+                else:
+                    for from_bsocket in from_bsockets:
+                        queue_link(self.bnode.id_data, from_bsocket, to_bsocket, append=True)
+                continue
+                
+            # Shared sockets: the enabled one, the parameters are already set
+            from_bsocket = output_bsocket(value)
+            to_bsockets  = [bsocket for bsocket in input_bsockets(self, name) if bsocket.enabled]
+            if tree is None or from_bsocket is None or len(to_bsockets) != 1:
+                self.set_input_socket(name, value)
+            else:
+                queue_link(self.bnode.id_data, from_bsocket, to_bsockets[0])
+                
+    # Writing an input socket replaces the queued link
+    
+    node_set_input_socket = Node.set_input_socket
+    def set_input_socket(self, name, value):
+        if PENDING_LINKS:
+            for bsocket in input_bsockets(self, name):
+                drop_links(bsocket)
+        return node_set_input_socket(self, name, value)
+    
+    node_plug = Node.plug
+    def plug(self, index, *values):
+        if PENDING_LINKS and not self.bnode.inputs[index].is_multi_input:
+            drop_links(self.bnode.inputs[index])
+        return node_plug(self, index, *values)
+    
+    # The tree exit creates the queued links, they are dropped if the block raised
+    
+    tree_exit = Tree.__exit__
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            flush_links()
+        else:
+            clear_links()
+        return tree_exit(self, exc_type, *args)
+    
+    Node.plug_sockets     = plug_sockets
+    Node.set_input_socket = set_input_socket
+    Node.plug             = plug
+    Tree.flush_links      = flush_links
+    Tree.__exit__         = __exit__
+    
+# - bulk_nodes    : nodes created by the bulk constructors Many from columns of arguments.
+#                   A list or a numpy array is a column giving one value per node, the other values
+#                   are shared by all the nodes. nodes_count is required when no argument is a column.
+#                   The values of a multi input socket are the same for all the nodes: a list of
+#                   sockets is never a column for a multi input socket.
+#                   The nodes are created without __init__ and the shared work is done once: the
+#                   enum values are checked once per distinct value, the defaults are read once and
+#                   the sockets plugged with the same value are listed once.
+
+try:
+    import numpy
+    COLUMN_TYPES = (list, numpy.ndarray)
+except ImportError:
+    COLUMN_TYPES = (list,)
+
+def bulk_column(value):
+    if not isinstance(value, COLUMN_TYPES):
+        return None
+    return value if isinstance(value, list) else value.tolist()
+
+NO_DEFAULT = object()
+
+def bulk_count(count, values):
+    for value in values:
+        column = bulk_column(value)
+        if column is None:
+            continue
+        if count is None:
+            count = len(column)
+        elif len(column) != count:
+            raise Exception(f"Bulk creation: column of length {{len(column)}} for {{count}} nodes")
+    if count is None:
+        raise Exception("Bulk creation: nodes_count is required when no argument is a column")
+    return count
+
+if not hasattr(Node, 'bulk_nodes'):
+    def bulk_nodes(cls, count, bl_idname, node_name, params=(), sockets=(), label=None, node_color=None):
+        
+        count = bulk_count(count, [param[1] for param in params] + [value for name, value in sockets if not isinstance(name, int)] + [label, node_color])
+        
+        labels = bulk_column(label)
+        colors = bulk_column(node_color)
+        nodes  = []
+        for i in range(count):
+            node = cls.__new__(cls)
+            Node.__init__(node, bl_idname, node_name=node_name,
+                          label=label if labels is None else labels[i], node_color=node_color if colors is None else colors[i])
+            nodes.append(node)
+        if not nodes:
+            return nodes
+        
+        # ----- Parameters, the default values are not written
+        
+        defaults = getattr(cls, 'parameters_defaults', {{}})
+        for name, value, values, default in params:
+            skip    = defaults.get(name, NO_DEFAULT)
+            checked = {{}}
             
-            # ----- Write the node
+            def check(v):
+                if values is None or (isinstance(v, str) and v in values):
+                    return v
+                if isinstance(v, str):
+                    if v not in checked:
+                        checked[v] = nodes[0].check_enum_value(v, name, values, default)
+                    return checked[v]
+                return nodes[0].check_enum_value(v, name, values, default)
             
-            f.write(f"\n# {'-'*100}\n")
-            f.write(f"# Node {wn.node_name} for {wn.bl_idname}\n")
+            column = bulk_column(value)
+            if column is None:
+                if value != skip:
+                    value = check(value)
+                    for node in nodes:
+                        setattr(node.bnode, name, value)
+            else:
+                for node, v in zip(nodes, column):
+                    if v != skip:
+                        setattr(node.bnode, name, check(v))
+                        
+        # ----- Sockets
+        
+        shared  = []
+        columns = []
+        for name, value in sockets:
+            column = None if isinstance(name, int) else bulk_column(value)
+            if column is not None:
+                columns.append((name, column))
+            elif value is not None:
+                shared.append((name, value))
+                
+        for i, node in enumerate(nodes):
+            node.plug_sockets(shared + [(name, column[i]) for name, column in columns])
             
+        return nodes
+    
+    Node.bulk_nodes = classmethod(bulk_nodes)
 
-            for line in wn.gen_node_class(cl_gen=code_gen.ALL):
-                f.write(line)
-                    
-            # ----- For creation by bl_idname
-            
-            creation.append(f"'{wn.bl_idname}': {wn.node_name}") 
+MENUS = ({smenus})
+
+def __getattr__(name):
+    if name in MENUS:
+        return importlib.import_module(f"{{__name__}}.{{name}}")
+    
+    nodes = importlib.import_module(f"{{__name__}}.nodes")
+    if name in nodes.NODE_MODULES:
+        cls = nodes.node_class(name)
+        globals()[name] = cls
+        return cls
+    
+    raise AttributeError(f"module '{{__name__}}' has no attribute '{{name}}'")
+
+"""
+
+# ----------------------------------------------------------------------------------------------------
+# Import time of the generated modules
+#
+# Each module source is compiled (first import, no cached bytecode) and executed
+# (import with cached bytecode). Without geonodes available, only the compilation is timed.
+# A module failing to compile or execute is reported: the generation is not interrupted.
+# - eager : all the node classes are loaded (previous single nodes module)
+# - lazy  : the facade is loaded, then one menu module per menu used
+
+def import_time_report(folder, modules):
+    
+    timings  = {}
+    failures = {}
+    for module in ['enums', 'nodes'] + list(modules):
+        fname = f"{folder}{module}.py"
+        with open(fname, 'r') as f:
+            source = f.read()
             
-        # ----- A function to create a node from the bl_idname
-        
-        f.write(f"# {'-'*80}\n")
-        f.write("# Create node from its bl_idname\n\n")
+        t0 = time.perf_counter()
+        try:
+            code = compile(source, fname, 'exec')
+            t_compile = time.perf_counter() - t0
+        except Exception as e:
+            timings[module] = (None, None)
+            failures[module] = f"{type(e).__name__}: {e}"
+            continue
         
-        f.write( "def create_node(bl_idname, *args, **kwargs):\n")
-        sdict = ",\n    ".join(creation)
-        O = "{"
-        C = "}"
-        f.write(f"    nodes = {O}{sdict}{C}\n")
-        f.write( "    return nodes[bl_idname](*args, **kwargs)\n\n")
+        t0 = time.perf_counter()
+        try:
+            exec(code, {'__name__': f"geonodes.nodes.{module}"})
+            t_exec = time.perf_counter() - t0
+        except ImportError:
+            t_exec = None
+        except Exception as e:
+            t_exec = None
+            failures[module] = f"{type(e).__name__}: {e}"
+            
+        timings[module] = (t_compile, t_exec)
         
+    def total(names, index):
+        values = [timings[name][index] for name in names]
+        return None if None in values else sum(values)*1000
+    
+    def sms(value):
+        return "   n.a." if value is None else f"{value:7.1f}"
+    
+    menus = list(modules)
+    sizes = [total([menu], 0) or 0. for menu in menus]
+    
+    print()
+    print("Nodes modules import time (ms)")
+    print()
+    print(f"{'':48s} {'compile':>7s} {'exec':>7s}")
+    print(f"{'eager: all the nodes':48s} {sms(total(['enums'] + menus, 0))} {sms(total(['enums'] + menus, 1))}")
+    print(f"{'lazy: facade only':48s} {sms(total(['nodes'], 0))} {sms(total(['nodes'], 1))}")
+    if menus:
+        big = menus[sizes.index(max(sizes))]
+        print(f"{'lazy: facade + largest menu ' + big:48s} {sms(total(['nodes', 'enums', big], 0))} {sms(total(['nodes', 'enums', big], 1))}")
+    print()
+    
+    if failures:
+        print("Modules failing at import:")
+        for module, error in failures.items():
+            print(f"- {module}: {error}")
+        print()
+    
+    return timings
         
 # ====================================================================================================
 # Build geonodes auto doc
@@ -2454,38 +4094,33 @@ def check_output_geometry_classes():
                 
                     
 # ====================================================================================================
-# Generate the nodes module
-                
-def create_geonodes(fpath, version, print_enums=False):
-    
-    gn_version = bpy.app.version + (version,)
-    
-    print("-"*80)
-    print("Generating nodes and sockets python from Blender geometry nodes")
-    print(f"Blender version: {bpy.app.version_string}")
-    print(f"Geonode version: {gn_version}")
-    print("")
-    
+# Generate the files from the node wrappers
+#
+# The node wrappers are either built from the Blender nodes or loaded from a catalog
                 
-    # ----- Create all the blender nodes
-    
-    BNODES = BNodes()
+# lean: the docstrings are stubs, the documentation is written in the doc store docstore.gnd
+#       and read on demand with geonodes.docstore (see code_gen.DocStore)
+# The doc store is always written, empty when not lean, to replace a previous one
 
-    # ----- Create all the wrappers
+def generate_files(fpath, wnodes, gn_version, version_string, lean=False):
+    
+    doc_store = code_gen.DocStore()
     
     print("Create nodes layer...")
 
-    for bnode in BNODES.values():
-        WNode(bnode)
-        
-    create_nodes(fpath, BNODES)
+    create_nodes(fpath, wnodes, version_string, doc_store=doc_store if lean else None)
         
     # ----- Generate the classes
     
     print("Create data classes...")
         
-    cg = code_gen.get_class_generators(WNode.WNODES)
-    cg.create_files(fpath, version=gn_version)
+    cg = code_gen.get_class_generators(wnodes)
+    cg.create_files(fpath, version=gn_version, doc_store=doc_store if lean else None)
+    
+    doc_store.write(fpath + "docstore.gnd")
+    code_gen.create_docstore_module(fpath + "docstore.py")
+    if lean:
+        print(f"Lean generation: {len(doc_store)} docstrings in the doc store")
     
     print("Create documentation...")
 
@@ -2498,21 +4133,183 @@ def create_geonodes(fpath, version, print_enums=False):
     
     print("Done")
     print()
+                    
+# ====================================================================================================
+# Generate the nodes module
+                
+def create_geonodes(fpath, version, print_enums=False, stream=False, cache=None, trace=None, top=20, lean=False):
+    
+    gn_version = bpy.app.version + (version,)
+    
+    print("-"*80)
+    print("Generating nodes and sockets python from Blender geometry nodes")
+    print(f"Blender version: {bpy.app.version_string}")
+    print(f"Geonode version: {gn_version}")
+    print("")
+    
+                
+    # ----- Create all the wrappers
+    
+    introspection_trace = None if trace is None else IntrospectionTrace()
+    
+    collect_wnodes(stream=stream, cache=cache, trace=introspection_trace)
+        
+    # ----- Generate the files
+        
+    generate_files(fpath, WNode.WNODES, gn_version, bpy.app.version_string, lean=lean)
     
     print(f"Version {gn_version} completed")
     print()
     print("Import geonodes.test_file to test the generation")
     print()
     print('-'*80)
-    print("NOTE: if new nodes are created, don't forget to run node_sizes():")
-    print("Node dimensions are intizalized to zero. To update the property correctly, go")
-    print("in the geometry nodes editor and then back to the script editor.")
-    print("Lauch generator.node_sizes() WITHOUT LAUNCHING create_geonodes AGAIN!")
-    print("... hope it works.")
+    if stream:
+        print("NOTE: the nodes have been removed from the tree in streaming mode.")
+        print("To run node_sizes(), launch create_geonodes with stream=False.")
+    else:
+        print("NOTE: if new nodes are created, don't forget to run node_sizes():")
+        print("Node dimensions are intizalized to zero. To update the property correctly, go")
+        print("in the geometry nodes editor and then back to the script editor.")
+        print("Lauch generator.node_sizes() WITHOUT LAUNCHING create_geonodes AGAIN!")
+        print("... hope it works.")
     
     if print_enums:
         print_all_enums()
+        
+    if introspection_trace is not None:
+        introspection_trace.write(trace)
+        introspection_trace.print_report(top=top)
+        print(f"Introspection trace written in {trace}")
+
+# ====================================================================================================
+# Node catalog
+#
+# The catalog is a json file containing everything the node wrappers learnt from Blender.
+# It is exported once from Blender:
+#
+#   export_catalog(fpath + "catalog 3.6.0.json")
+#
+# The generation can then run in a plain python process without Blender:
+#
+#   create_geonodes_from_catalog(fpath, fpath + "catalog 3.6.0.json", version)
+#
+# CATALOG_VERSION must be incremented when the format changes
+    
+CATALOG_VERSION = 4
+
+def catalog_dict(wnodes):
+    return {
+        'CATALOG_VERSION' : CATALOG_VERSION,
+        'VERSION'         : bpy.app.version_string,
+        'blender_version' : list(bpy.app.version),
+        'nodes'           : {blid: wnode.to_dict() for blid, wnode in wnodes.items()},
+        }
+
+def dump_catalog(fname, catalog):
+    with open(fname, 'w') as f:
+        json.dump(catalog, f, indent=1)
+
+def write_catalog(fname, wnodes):
+    
+    dump_catalog(fname, catalog_dict(wnodes))
+        
+    print(f"Catalog of {len(wnodes)} nodes written in {fname}")
+    
+def export_catalog(fname, stream=True, cache=None):
+    
+    # Only the nodes collected by this call are exported
+    WNode.WNODES.clear()
+    collect_wnodes(stream=stream, cache=cache)
+        
+    write_catalog(fname, WNode.WNODES)
+    
+# ----------------------------------------------------------------------------------------------------
+# Part of the catalog exported by a worker process (see workers.py)
+#
+# The candidate types are shared between the workers: worker k explores the types k, k + workers, ...
+# The position of each node in the candidate list is exported to allow a deterministic merge.
 
+def export_catalog_part(fname, worker, workers, cache=None):
+    
+    t0 = time.perf_counter()
+    
+    node_types = list(BNodes.node_types())
+    cached     = cached_nodes(cache)
+    
+    WNode.WNODES.clear()
+    for bnode in BNodes.stream(node_types[worker::workers]):
+        signature = node_signature(bnode)
+        data = cached.get(bnode.bl_idname)
+        if data is not None and data['signature'] == signature:
+            WNode.FromDict(data)
+        else:
+            WNode(bnode, signature=signature).detach()
+        
+    catalog = catalog_dict(WNode.WNODES)
+    catalog['order']  = {blid: node_types.index(blid) for blid in WNode.WNODES}
+    catalog['timing'] = {
+        'worker'        : worker,
+        'candidates'    : len(node_types[worker::workers]),
+        'nodes'         : len(WNode.WNODES),
+        'introspection' : time.perf_counter() - t0,
+        }
+    
+    dump_catalog(fname, catalog)
+    
+def read_catalog(fname):
+    
+    with open(fname, 'r') as f:
+        catalog = json.load(f)
+        
+    if catalog.get('CATALOG_VERSION') != CATALOG_VERSION:
+        raise Exception(f"Catalog '{fname}' version {catalog.get('CATALOG_VERSION')} is not supported, version {CATALOG_VERSION} is expected. Export the catalog again.")
+        
+    return catalog
+
+# ----------------------------------------------------------------------------------------------------
+# Nodes of a previous catalog used as a cache
+# An unreadable cache is ignored: all the nodes are explored
+
+def cached_nodes(cache):
+    
+    if cache is None:
+        return {}
+    
+    try:
+        return read_catalog(cache)['nodes']
+    except Exception as e:
+        print(f"Catalog cache ignored: {e}")
+        return {}
+
+def load_catalog(fname):
+    
+    catalog = read_catalog(fname)
+        
+    WNode.WNODES.clear()
+    for data in catalog['nodes'].values():
+        WNode.FromDict(data)
+        
+    return catalog
+
+# ----------------------------------------------------------------------------------------------------
+# Generate the nodes module from a catalog
+
+def create_geonodes_from_catalog(fpath, fname, version, lean=False):
+    
+    catalog    = load_catalog(fname)
+    gn_version = tuple(catalog['blender_version']) + (version,)
+    
+    print("-"*80)
+    print("Generating nodes and sockets python from a geometry nodes catalog")
+    print(f"Catalog        : {fname}")
+    print(f"Blender version: {catalog['VERSION']}")
+    print(f"Geonode version: {gn_version}")
+    print("")
+    
+    generate_files(fpath, WNode.WNODES, gn_version, catalog['VERSION'], lean=lean)
+    
+    print(f"Version {gn_version} completed")
+    
 # ====================================================================================================
 # Generate the nodes module
                     
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:05:12 2026
+
+@author: alain
+
+bpy stand-in for the tests
+
+A few geometry nodes with the attributes read by the introspection: parameters, enums
+(static or built at run time), input and output sockets with their enablement rules.
+The enum errors have the message raised by Blender.
+"""
+
+import types as _types
+
+# ====================================================================================================
+# Application
+
+class _App:
+    version        = (3, 6, 0)
+    version_string = "3.6.0"
+
+app = _App()
+
+# ====================================================================================================
+# RNA
+
+class bpy_struct: pass
+class bpy_func: pass
+class bpy_prop_collection: pass
+class bpy_prop_array: pass
+
+class EnumItem:
+    def __init__(self, identifier):
+        self.identifier = identifier
+
+class Property:
+    def __init__(self, prop_type, items=(), dynamic=False):
+        self.type              = prop_type
+        self.is_enum_flag      = False
+        self.enum_items_static = [] if dynamic else [EnumItem(item) for item in items]
+        self.enum_items        = self.enum_items_static
+
+class RNA:
+    def __init__(self, properties):
+        self.properties = properties
+
+# ====================================================================================================
+# Nodes
+
+STD = ['__doc__', '__module__', '__slots__', 'bl_description', 'bl_idname', 'bl_label', 'bl_rna', 'color',
+       'inputs', 'outputs', 'label', 'location', 'name', 'rna_type', 'type', 'width', 'dimensions']
+
+class Socket:
+    def __init__(self, node, name, bl_idname, is_output, is_multi_input=False, rule=None):
+        self.node           = node
+        self.name           = name
+        self.bl_idname      = bl_idname
+        self.is_output      = is_output
+        self.is_multi_input = is_multi_input
+        self.display_shape  = 'CIRCLE'
+        self.rule           = rule
+
+    @property
+    def enabled(self):
+        return True if self.rule is None else bool(self.rule(self.node))
+
+class Node:
+    def __init__(self, bl_idname):
+        spec = SPECS[bl_idname]
+        object.__setattr__(self, '_params', dict(spec['params']))
+        object.__setattr__(self, '_enums', spec.get('enums', {}))
+        self.bl_idname = bl_idname
+        self.name      = spec['name']
+        dynamic = spec.get('dynamic', ())
+        self.bl_rna = RNA({name: Property('ENUM', self._enums[name], name in dynamic) if name in self._enums else Property(type(value).__name__.upper())
+                           for name, value in spec['params'].items()})
+        self.inputs  = [Socket(self, *socket[:2], False, *socket[2:]) for socket in spec['inputs']]
+        self.outputs = [Socket(self, *socket[:2], True, *socket[2:]) for socket in spec['outputs']]
+
+    def __dir__(self):
+        return sorted(set(STD) | set(self._params))
+
+    def __getattr__(self, name):
+        params = object.__getattribute__(self, '_params')
+        if name in params:
+            return params[name]
+        if name in STD:
+            return None
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        params = self.__dict__.get('_params', {})
+        if name not in params:
+            object.__setattr__(self, name, value)
+            return
+        values = self._enums.get(name)
+        if values is not None and value not in values:
+            raise TypeError(f'bpy_struct: item.attr = val: enum "{value}" not found in {tuple(values)}')
+        params[name] = value
+
+class Nodes(list):
+    def new(self, bl_idname):
+        if bl_idname not in SPECS:
+            raise RuntimeError(f"Node type {bl_idname} undefined")
+        node = Node(bl_idname)
+        self.append(node)
+        return node
+
+class NodeTree:
+    def __init__(self):
+        self.nodes = Nodes()
+
+class _NodeGroups(dict):
+    def new(self, name, tree_type):
+        self[name] = NodeTree()
+        return self[name]
+
+class _Data:
+    node_groups = _NodeGroups()
+
+data = _Data()
+
+# ====================================================================================================
+# Node types
+
+F, I, V, S, G, B = 'NodeSocketFloat', 'NodeSocketInt', 'NodeSocketVector', 'NodeSocketString', 'NodeSocketGeometry', 'NodeSocketBool'
+
+SPECS = {
+    'ShaderNodeMath': dict(name='Math',
+        params  = {'operation': 'ADD', 'use_clamp': False},
+        enums   = {'operation': ['ADD', 'SUBTRACT', 'MULTIPLY', 'MULTIPLY_ADD', 'SINE', 'COMPARE']},
+        inputs  = [('Value', F), ('Value', F, False, lambda n: n.operation != 'SINE'), ('Value', F, False, lambda n: n.operation in ('MULTIPLY_ADD', 'COMPARE'))],
+        outputs = [('Value', F)]),
+    'FunctionNodeCompare': dict(name='Compare',
+        params  = {'data_type': 'FLOAT', 'operation': 'GREATER_THAN', 'mode': 'ELEMENT'},
+        enums   = {'data_type': ['FLOAT', 'INT', 'STRING'], 'operation': ['LESS_THAN', 'GREATER_THAN', 'EQUAL', 'NOT_EQUAL'], 'mode': ['ELEMENT', 'LENGTH']},
+        inputs  = [('A', F, False, lambda n: n.data_type == 'FLOAT'), ('B', F, False, lambda n: n.data_type == 'FLOAT'),
+                   ('A', I, False, lambda n: n.data_type == 'INT'), ('B', I, False, lambda n: n.data_type == 'INT'),
+                   ('A', S, False, lambda n: n.data_type == 'STRING'), ('B', S, False, lambda n: n.data_type == 'STRING'),
+                   ('Epsilon', F, False, lambda n: n.operation in ('EQUAL', 'NOT_EQUAL'))],
+        outputs = [('Result', B)]),
+    'GeometryNodeSetPosition': dict(name='Set Position',
+        params  = {},
+        inputs  = [('Geometry', G), ('Selection', B), ('Position', V), ('Offset', V)],
+        outputs = [('Geometry', G)]),
+    'GeometryNodeJoinGeometry': dict(name='Join Geometry',
+        params  = {},
+        inputs  = [('Geometry', G, True)],
+        outputs = [('Geometry', G)]),
+    'GeometryNodeCaptureAttribute': dict(name='Capture Attribute',
+        params  = {'data_type': 'FLOAT', 'domain': 'POINT'},
+        enums   = {'data_type': ['FLOAT', 'INT', 'FLOAT_VECTOR'], 'domain': ['POINT', 'EDGE', 'FACE']},
+        dynamic = {'data_type'},
+        inputs  = [('Geometry', G), ('Value', V, False, lambda n: n.data_type == 'FLOAT_VECTOR'),
+                   ('Value', F, False, lambda n: n.data_type == 'FLOAT'), ('Value', I, False, lambda n: n.data_type == 'INT')],
+        outputs = [('Geometry', G), ('Attribute', V, False, lambda n: n.data_type == 'FLOAT_VECTOR'),
+                   ('Attribute', F, False, lambda n: n.data_type == 'FLOAT'), ('Attribute', I, False, lambda n: n.data_type == 'INT')]),
+    }
+
+types = _types.SimpleNamespace(bpy_struct=bpy_struct, bpy_func=bpy_func, bpy_prop_collection=bpy_prop_collection, bpy_prop_array=bpy_prop_array)
+types.Node = type('Node', (), {})
+for _name in list(SPECS) + ['GeometryNode', 'GeometryNodeUnknown']:
+    setattr(types, _name, type(_name, (types.Node,), {}))
+for _name in ['Object', 'Mesh']:
+    setattr(types, _name, type(_name, (), {}))
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:05:12 2026
+
+@author: alain
+
+mathutils stand-in for the tests
+"""
+
+class Vector(list):
+    pass
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:05:12 2026
+
+@author: alain
+
+Parallel catalog export
+
+The catalog merged from the workers must be byte-identical to the catalog exported by
+a single process. Blender is replaced by the bpy stand-in of tests/bpy_standin, the
+workers are python processes.
+
+The modules are imported as the package generator: the repository is linked as
+generator in a temporary folder.
+
+python -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+REPO    = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STANDIN = os.path.join(REPO, "tests", "bpy_standin")
+
+class TestParallelCatalog(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.folder = tempfile.TemporaryDirectory(prefix="geonodes_test_")
+        os.symlink(REPO, os.path.join(cls.folder.name, "generator"))
+
+        cls.path = sys.path[:]
+        cls.env  = os.environ.get('PYTHONPATH')
+        sys.path[:0] = [STANDIN, cls.folder.name]
+        os.environ['PYTHONPATH'] = os.pathsep.join([STANDIN, cls.folder.name] + ([cls.env] if cls.env else []))
+
+        from generator import nodes_gen, workers
+        cls.nodes_gen = nodes_gen
+        cls.workers   = workers
+
+    @classmethod
+    def tearDownClass(cls):
+        sys.path[:] = cls.path
+        if cls.env is None:
+            del os.environ['PYTHONPATH']
+        else:
+            os.environ['PYTHONPATH'] = cls.env
+        cls.folder.cleanup()
+
+    def read(self, fname):
+        with open(fname, 'rb') as f:
+            return f.read()
+
+    def test_merge_is_identical(self):
+
+        serial = os.path.join(self.folder.name, "serial.json")
+        self.nodes_gen.export_catalog(serial)
+
+        for workers in (1, 2, 3):
+            parallel = os.path.join(self.folder.name, f"parallel {workers}.json")
+            self.workers.export_catalog_parallel(parallel, workers=workers, command=[sys.executable, '-c'])
+            self.assertEqual(self.read(serial), self.read(parallel), f"{workers} workers")
+
+    def test_dynamic_enum(self):
+
+        catalog = self.nodes_gen.read_catalog(self.export())
+        params  = {param['name']: param for param in catalog['nodes']['GeometryNodeCaptureAttribute']['parameters']}
+        self.assertEqual(params['data_type']['values'], ['FLOAT', 'INT', 'FLOAT_VECTOR'])
+
+    def test_only_node_types(self):
+
+        self.assertEqual(sorted(self.nodes_gen.BNodes.node_types()),
+            ['FunctionNodeCompare', 'GeometryNodeCaptureAttribute', 'GeometryNodeJoinGeometry', 'GeometryNodeSetPosition',
+             'GeometryNodeUnknown', 'ShaderNodeMath'])
+
+    def test_failed_worker(self):
+
+        before = set(os.listdir(tempfile.gettempdir()))
+        with self.assertRaises(Exception):
+            self.workers.export_catalog_parallel(os.path.join(self.folder.name, "failed.json"), workers=2,
+                command=[sys.executable, '-c', 'raise SystemExit(1)', '--'])
+        created = [name for name in set(os.listdir(tempfile.gettempdir())) - before if name.startswith("geonodes_catalog_")]
+        self.assertEqual(created, [])
+
+    def export(self):
+        fname = os.path.join(self.folder.name, "export.json")
+        self.nodes_gen.export_catalog(fname)
+        return fname
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 09:42:15 2026
+
+@author: alain
+
+Parallel export of the nodes catalog
+
+The candidate types are split between several background Blender processes.
+Each worker exports a part of the catalog (see nodes_gen.export_catalog_part).
+The parts are merged in the order of the candidate types: the merged catalog is
+identical to the one exported by a single process with nodes_gen.export_catalog.
+
+Use (Blender is not required to launch the workers):
+
+from generator import workers
+
+workers.export_catalog_parallel(fname, workers=4, blender="/path/to/blender")
+
+The command can be replaced by any python process providing bpy:
+
+workers.export_catalog_parallel(fname, command=[sys.executable, '-c'])
+
+With cache=<previous catalog file>, only the nodes whose signature changed are explored.
+"""
+
+import os
+import json
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from generator import nodes_gen
+
+# ====================================================================================================
+# Worker script
+
+GENERATOR_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WORKER_SCRIPT = """
+import sys
+sys.path.insert(0, {path!r})
+from generator import nodes_gen
+nodes_gen.export_catalog_part({fname!r}, {worker}, {workers}, cache={cache!r})
+"""
+
+def worker_command(blender="blender", command=None):
+    if command is None:
+        return [blender, '--background', '--factory-startup', '--python-expr']
+    else:
+        return list(command)
+
+# ----------------------------------------------------------------------------------------------------
+# Run one worker
+#
+# Returns the process duration
+
+def run_worker(cmd, fname, worker, workers, cache=None):
+
+    script = WORKER_SCRIPT.format(path=GENERATOR_PATH, fname=fname, worker=worker, workers=workers, cache=cache)
+
+    t0 = time.perf_counter()
+    res = subprocess.run(cmd + [script], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    duration = time.perf_counter() - t0
+
+    if res.returncode != 0 or not os.path.exists(fname):
+        raise Exception(f"Catalog worker {worker} failed (return code {res.returncode}):\n{res.stdout[-2000:]}")
+
+    return duration
+
+# ====================================================================================================
+# Merge the catalog parts
+
+def merge_catalogs(parts):
+
+    first = parts[0]
+    for part in parts[1:]:
+        if (part['CATALOG_VERSION'], part['VERSION']) != (first['CATALOG_VERSION'], first['VERSION']):
+            raise Exception(f"Catalog parts are not consistent: {part['VERSION']} vs {first['VERSION']}")
+
+    order = {}
+    nodes = {}
+    for part in parts:
+        order.update(part['order'])
+        nodes.update(part['nodes'])
+
+    return {
+        'CATALOG_VERSION' : first['CATALOG_VERSION'],
+        'VERSION'         : first['VERSION'],
+        'blender_version' : first['blender_version'],
+        'nodes'           : {blid: nodes[blid] for blid in sorted(nodes, key=lambda blid: order[blid])},
+        }
+
+# ----------------------------------------------------------------------------------------------------
+# Timing report
+
+def print_timing(parts, durations, total):
+
+    print()
+    print("Catalog workers")
+    print()
+    print(f"{'worker':>6s} {'types':>6s} {'nodes':>6s} {'introspection':>14s} {'process':>9s}")
+    for part, duration in zip(parts, durations):
+        timing = part['timing']
+        print(f"{timing['worker']:6d} {timing['candidates']:6d} {timing['nodes']:6d} {timing['introspection']:12.2f} s {duration:7.2f} s")
+    print()
+    print(f"Total: {total:.2f} s")
+    print()
+
+# ====================================================================================================
+# Export the catalog with several workers
+
+def export_catalog_parallel(fname, workers=4, blender="blender", command=None, keep_parts=False, cache=None):
+
+    cmd    = worker_command(blender, command)
+    folder = tempfile.mkdtemp(prefix="geonodes_catalog_")
+    fnames = [os.path.join(folder, f"catalog part {worker}.json") for worker in range(workers)]
+
+    # The parts folder is removed even if a worker fails, unless keep_parts is set
+
+    try:
+        t0 = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_worker, cmd, fnames[worker], worker, workers, cache) for worker in range(workers)]
+            durations = [future.result() for future in futures]
+
+        parts = []
+        for part_name in fnames:
+            with open(part_name, 'r') as f:
+                parts.append(json.load(f))
+
+        catalog = merge_catalogs(parts)
+        nodes_gen.dump_catalog(fname, catalog)
+
+        print_timing(parts, durations, time.perf_counter() - t0)
+        print(f"Catalog of {len(catalog['nodes'])} nodes written in {fname}")
+
+    finally:
+        if keep_parts:
+            print(f"Catalog parts kept in {folder}")
+        else:
+            shutil.rmtree(folder, ignore_errors=True)
+
+    return catalog